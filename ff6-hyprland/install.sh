@@ -543,8 +543,12 @@ done
 
 # Copy kitty configuration
 copy_config "kitty/kitty.conf" "$KITTY_DIR/kitty.conf"
-copy_config "kitty/ff_sprite.py" "$KITTY_DIR/ff_sprite.py"
-chmod +x "$KITTY_DIR/ff_sprite.py"
+for module in kitty/*.py kitty/*.sh; do
+    if [ -f "$module" ]; then
+        copy_config "$module" "$KITTY_DIR/$(basename "$module")"
+    fi
+done
+chmod +x "$KITTY_DIR/ff_sprite.py" "$KITTY_DIR/ff_sprite_daemon.py" "$KITTY_DIR/ff_sprite_client.sh" "$KITTY_DIR/ff_sprite_anim.py" "$KITTY_DIR/ff_sprite_atlas.py" "$KITTY_DIR/ff_sprite_profile.py" "$KITTY_DIR/ff_sprite_bench.py" "$KITTY_DIR/ff_sound.py"
 
 # Copy swappy configuration
 copy_config "swappy/config" "$SWAPPY_DIR/config"
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# Final Fantasy Sound Effect Synthesizer
+# Theme: Final Fantasy VI Menu Style
+#
+# Generates the theme's menu sounds in one process with the standard library
+# only, replacing one sox invocation per effect. Each effect is a sine tone
+# swept linearly through its frequencies, faded out at the end and scaled by
+# its volume, written as 16-bit mono WAV. Rendered samples are cached by
+# effect parameters, and files whose contents would not change are left
+# untouched.
+#
+# Usage: ff_sound.py [-o DIR] [effect...]
+
+import array
+import io
+import math
+import os
+import sys
+import wave
+from functools import lru_cache
+
+RATE = 44100
+SOUNDS_DIR = os.path.join(os.path.expanduser("~/.config"), "hypr", "sounds")
+
+# name: (duration, frequencies to sweep through, fade-out, volume)
+EFFECTS = {
+    "cursor": (0.05, (1200,), 0.02, 0.5),
+    "confirm": (0.1, (800, 1200), 0.03, 0.5),
+    "menu_open": (0.15, (600, 900), 0.05, 0.5),
+    "error": (0.2, (300, 200), 0.05, 0.5),
+    "battle": (0.3, (400, 800, 400), 0.1, 0.6),
+    "victory": (0.5, (600, 900, 1200), 0.2, 0.6),
+    "save": (0.4, (800, 1000, 1200), 0.1, 0.5),
+}
+
+# Little-endian 16-bit PCM samples for an effect
+@lru_cache(maxsize=None)
+def synthesize(duration, frequencies, fade_out, volume, rate=RATE):
+    count = round(duration * rate)
+    samples = array.array("h", bytes(2 * count))
+    peak = 32767 * volume
+    step = 2 * math.pi / rate
+    sin = math.sin
+    phase = 0.0
+
+    # Sweep linearly from each frequency to the next over equal parts of the
+    # sound, keeping the phase continuous
+    segments = max(len(frequencies) - 1, 1)
+    for segment in range(segments):
+        start = count * segment // segments
+        end = count * (segment + 1) // segments
+        low = frequencies[segment]
+        high = frequencies[min(segment + 1, len(frequencies) - 1)]
+        slope = (high - low) / max(end - start, 1)
+        for i in range(start, end):
+            samples[i] = int(peak * sin(phase))
+            phase += step * (low + slope * (i - start))
+
+    fade = min(round(fade_out * rate), count)
+    for i in range(count - fade, count):
+        samples[i] = samples[i] * (count - i) // fade
+
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+def wav_bytes(frames, rate=RATE):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(frames)
+    return buffer.getvalue()
+
+# Write an effect to path unless it already holds the same sound.
+# Returns True if the file was written.
+def write_effect(name, path):
+    data = wav_bytes(synthesize(*EFFECTS[name]))
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the FF6 theme sound effects.")
+    parser.add_argument("effects", nargs="*", metavar="effect", help=f"effects to generate (default: all of {', '.join(EFFECTS)})")
+    parser.add_argument("-o", "--output", default=SOUNDS_DIR, help=f"directory for the WAV files (default: {SOUNDS_DIR})")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.effects if name not in EFFECTS]
+    if unknown:
+        parser.error(f"unknown effect: {', '.join(unknown)}")
+    try:
+        os.makedirs(args.output, exist_ok=True)
+        for name in args.effects or EFFECTS:
+            written = write_effect(name, os.path.join(args.output, f"{name}.wav"))
+            print(f"{name}.wav: {'generated' if written else 'unchanged'}")
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,309 +2,120 @@
 # Final Fantasy Sprite Display Script for Kitty Terminal
 # Theme: Final Fantasy VI Menu Style with authentic character sprites
 # Created: April 2025
+#
+# Every kitty window runs this script, so the common path never touches the
+# sprite table: all frames are rendered once into a binary cache file which
+# is mmapped and written out with a single write. The cache is keyed by a
+# checksum of the sources below and rebuilds itself whenever they change.
+# When ff_sprite_daemon.py is running, frames are fetched from it instead.
+#
+# Inside kitty the sprite is drawn as a real image through the kitty graphics
+# protocol; other terminals get half-block characters in the richest color
+# depth they support. FF_SPRITE_MODE (kitty, truecolor, 256 or 16) overrides
+# the detection.
+#
+# Random sprites are picked by ff_sprite_packs.py from the built-in packs and
+# the atlases imported into ATLAS_DIR with ff_sprite_atlas.py, without
+# repeating recent picks. FF_SPRITE_GAMES (e.g. ff6,ff4) limits the choice.
+#
+# FF_SPRITE_ANIMATE=1 hands over to ff_sprite_anim.py for an idling sprite.
+# FF_SPRITE_PROFILE=1 logs the timing of each launch; see ff_sprite_profile.py.
 
-import random
-import datetime
 import os
 import sys
+import time
 
-# ANSI color codes for more vibrant, authentic FF character colors
-class Colors:
-    RESET = "\033[0m"
-    BLACK = "\033[30m"
-    RED = "\033[31m"
-    GREEN = "\033[32m"
-    YELLOW = "\033[33m"
-    BLUE = "\033[34m"
-    MAGENTA = "\033[35m"
-    CYAN = "\033[36m"
-    WHITE = "\033[37m"
-    BRIGHT_BLACK = "\033[90m"
-    BRIGHT_RED = "\033[91m"
-    BRIGHT_GREEN = "\033[92m"
-    BRIGHT_YELLOW = "\033[93m"
-    BRIGHT_BLUE = "\033[94m"
-    BRIGHT_MAGENTA = "\033[95m"
-    BRIGHT_CYAN = "\033[96m"
-    BRIGHT_WHITE = "\033[97m"
-    BOLD = "\033[1m"
-    
-    # Custom colors for authentic FF character sprites
-    TERRA_GREEN = "\033[38;2;0;180;0m"
-    TERRA_HAIR = "\033[38;2;0;255;128m"
-    LOCKE_BLUE = "\033[38;2;100;140;220m"
-    LOCKE_SKIN = "\033[38;2;255;200;160m"
-    EDGAR_BLUE = "\033[38;2;50;100;255m"
-    EDGAR_HAIR = "\033[38;2;255;240;150m"
-    SABIN_ORANGE = "\033[38;2;255;160;0m"
-    SABIN_SKIN = "\033[38;2;255;190;140m"
-    CYAN_BLUE = "\033[38;2;0;100;200m"
-    CYAN_ARMOR = "\033[38;2;0;150;255m"
-    SHADOW_PURPLE = "\033[38;2;100;0;100m"
-    SHADOW_GRAY = "\033[38;2;100;100;100m"
-    CELES_YELLOW = "\033[38;2;255;255;150m"
-    CELES_ARMOR = "\033[38;2;200;200;255m"
-    SETZER_COAT = "\033[38;2;180;180;180m"
-    SETZER_HAIR = "\033[38;2;220;220;220m"
-    RELM_RED = "\033[38;2;255;100;100m"
-    RELM_YELLOW = "\033[38;2;255;255;100m"
-    STRAGO_BLUE = "\033[38;2;100;100;255m"
-    STRAGO_ROBE = "\033[38;2;80;80;200m"
-    MOG_PINK = "\033[38;2;255;180;220m"
-    MOG_FUR = "\033[38;2;255;220;240m"
-    UMARO_BLUE = "\033[38;2;150;200;255m"
-    UMARO_FUR = "\033[38;2;220;240;255m"
-    GOGO_YELLOW = "\033[38;2;255;220;0m"
-    GOGO_ROBE = "\033[38;2;255;180;0m"
-    KEFKA_RED = "\033[38;2;255;50;50m"
-    KEFKA_YELLOW = "\033[38;2;255;255;50m"
-    KEFKA_GREEN = "\033[38;2;50;255;50m"
-    KEFKA_BLUE = "\033[38;2;50;50;255m"
-    KEFKA_PURPLE = "\033[38;2;200;50;200m"
-    ULTROS_PURPLE = "\033[38;2;180;50;180m"
-    ULTROS_PINK = "\033[38;2;255;150;220m"
-    GILGAMESH_RED = "\033[38;2;220;50;50m"
-    GILGAMESH_GRAY = "\033[38;2;150;150;150m"
-    EXDEATH_BLUE = "\033[38;2;50;50;150m"
-    EXDEATH_PURPLE = "\033[38;2;100;0;100m"
-    GOLBEZ_PURPLE = "\033[38;2;120;0;120m"
-    GOLBEZ_ARMOR = "\033[38;2;80;0;80m"
-    GARLAND_BLUE = "\033[38;2;0;0;150m"
-    GARLAND_ARMOR = "\033[38;2;50;50;100m"
-    CHAOS_RED = "\033[38;2;200;0;0m"
-    CHAOS_ORANGE = "\033[38;2;255;100;0m"
-
-# More detailed and colorful Final Fantasy character sprites
-ff_sprites = {
-    # FF6 Characters
-    "Terra": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.TERRA_HAIR}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.TERRA_HAIR}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.TERRA_HAIR}█{Colors.BLACK}▀{Colors.TERRA_HAIR}███{Colors.BLACK}▀{Colors.TERRA_HAIR}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.TERRA_GREEN}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.TERRA_GREEN}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.TERRA_GREEN}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.TERRA_GREEN}█{Colors.BLACK}▀▀▀{Colors.TERRA_GREEN}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.TERRA_GREEN}█{Colors.BLACK} {Colors.TERRA_GREEN}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Locke": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_YELLOW}▄▄{Colors.LOCKE_SKIN}███{Colors.BRIGHT_YELLOW}▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}█{Colors.BLACK}▀{Colors.LOCKE_SKIN}███{Colors.BLACK}▀{Colors.LOCKE_SKIN}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_BLUE}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.LOCKE_BLUE}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_BLUE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.LOCKE_BLUE}█{Colors.BLACK}▀▀▀{Colors.LOCKE_BLUE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.LOCKE_BLUE}█{Colors.BLACK} {Colors.LOCKE_BLUE}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Edgar": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.EDGAR_HAIR}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EDGAR_HAIR}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EDGAR_HAIR}█{Colors.BLACK}▀{Colors.EDGAR_HAIR}███{Colors.BLACK}▀{Colors.EDGAR_HAIR}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EDGAR_BLUE}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.EDGAR_BLUE}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EDGAR_BLUE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.EDGAR_BLUE}█{Colors.BLACK}▀▀▀{Colors.EDGAR_BLUE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.EDGAR_BLUE}█{Colors.BLACK} {Colors.EDGAR_BLUE}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Sabin": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.EDGAR_HAIR}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EDGAR_HAIR}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EDGAR_HAIR}█{Colors.BLACK}▀{Colors.EDGAR_HAIR}███{Colors.BLACK}▀{Colors.EDGAR_HAIR}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SABIN_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SABIN_ORANGE}▄{Colors.SABIN_SKIN}▀▀▀▀▀{Colors.SABIN_ORANGE}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SABIN_ORANGE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.SABIN_ORANGE}█{Colors.BLACK}▀▀▀{Colors.SABIN_ORANGE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.SABIN_ORANGE}█{Colors.BLACK} {Colors.SABIN_ORANGE}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Cyan": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.BLACK}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BLACK}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BLACK}█{Colors.BLACK}▀{Colors.BLACK}███{Colors.BLACK}▀{Colors.BLACK}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CYAN_ARMOR}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.CYAN_ARMOR}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CYAN_BLUE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.CYAN_BLUE}█{Colors.BLACK}▀▀▀{Colors.CYAN_BLUE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.CYAN_BLUE}█{Colors.BLACK} {Colors.CYAN_BLUE}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Shadow": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.SHADOW_GRAY}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SHADOW_GRAY}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SHADOW_GRAY}█{Colors.RED}▀{Colors.SHADOW_GRAY}███{Colors.RED}▀{Colors.SHADOW_GRAY}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SHADOW_PURPLE}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.SHADOW_PURPLE}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SHADOW_PURPLE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.SHADOW_PURPLE}█{Colors.BLACK}▀▀▀{Colors.SHADOW_PURPLE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.SHADOW_PURPLE}█{Colors.BLACK} {Colors.SHADOW_PURPLE}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Celes": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.CELES_YELLOW}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CELES_YELLOW}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CELES_YELLOW}█{Colors.BLACK}▀{Colors.CELES_YELLOW}███{Colors.BLACK}▀{Colors.CELES_YELLOW}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CELES_ARMOR}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.CELES_ARMOR}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CELES_ARMOR}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.CELES_ARMOR}█{Colors.BLACK}▀▀▀{Colors.CELES_ARMOR}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.CELES_ARMOR}█{Colors.BLACK} {Colors.CELES_ARMOR}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Setzer": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.SETZER_HAIR}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SETZER_HAIR}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SETZER_HAIR}█{Colors.BLACK}▀{Colors.SETZER_HAIR}███{Colors.BLACK}▀{Colors.SETZER_HAIR}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SETZER_COAT}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.SETZER_COAT}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.SETZER_COAT}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.SETZER_COAT}█{Colors.BLACK}▀▀▀{Colors.SETZER_COAT}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.SETZER_COAT}█{Colors.BLACK} {Colors.SETZER_COAT}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Mog": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.MOG_FUR}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.MOG_FUR}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.MOG_FUR}█{Colors.RED}▀{Colors.MOG_FUR}███{Colors.RED}▀{Colors.MOG_FUR}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.MOG_FUR}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.MOG_PINK}▄{Colors.MOG_FUR}▀▀▀▀▀{Colors.MOG_PINK}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.MOG_PINK}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.MOG_PINK}█{Colors.BLACK}▀▀▀{Colors.MOG_PINK}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.MOG_PINK}█{Colors.BLACK} {Colors.MOG_PINK}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Kefka": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.KEFKA_YELLOW}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.KEFKA_YELLOW}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.KEFKA_YELLOW}█{Colors.BLACK}▀{Colors.KEFKA_YELLOW}███{Colors.BLACK}▀{Colors.KEFKA_YELLOW}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.WHITE}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.KEFKA_RED}▄{Colors.KEFKA_GREEN}▀{Colors.KEFKA_BLUE}▀{Colors.KEFKA_PURPLE}▀{Colors.KEFKA_RED}▀{Colors.KEFKA_GREEN}▀{Colors.KEFKA_RED}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.KEFKA_RED}██{Colors.KEFKA_GREEN}█{Colors.KEFKA_BLUE}█{Colors.KEFKA_PURPLE}█{Colors.KEFKA_RED}█{Colors.KEFKA_GREEN}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.KEFKA_RED}█{Colors.BLACK}▀▀▀{Colors.KEFKA_RED}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.KEFKA_RED}█{Colors.BLACK} {Colors.KEFKA_RED}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Ultros": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.ULTROS_PURPLE}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.ULTROS_PURPLE}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.ULTROS_PURPLE}█{Colors.WHITE}▀{Colors.ULTROS_PURPLE}███{Colors.WHITE}▀{Colors.ULTROS_PURPLE}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.ULTROS_PURPLE}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.ULTROS_PINK}▄{Colors.ULTROS_PURPLE}▀▀▀▀▀{Colors.ULTROS_PINK}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.ULTROS_PINK}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.ULTROS_PINK}█{Colors.BLACK}▀▀▀{Colors.ULTROS_PINK}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.ULTROS_PINK}█{Colors.BLACK} {Colors.ULTROS_PINK}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    
-    # FF5 Characters
-    "Bartz": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.BRIGHT_YELLOW}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_YELLOW}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_YELLOW}█{Colors.BLACK}▀{Colors.BRIGHT_YELLOW}███{Colors.BLACK}▀{Colors.BRIGHT_YELLOW}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_BLUE}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.BRIGHT_BLUE}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_BLUE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.BRIGHT_BLUE}█{Colors.BLACK}▀▀▀{Colors.BRIGHT_BLUE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.BRIGHT_BLUE}█{Colors.BLACK} {Colors.BRIGHT_BLUE}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Gilgamesh": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.GILGAMESH_GRAY}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GILGAMESH_GRAY}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GILGAMESH_GRAY}█{Colors.BLACK}▀{Colors.GILGAMESH_GRAY}███{Colors.BLACK}▀{Colors.GILGAMESH_GRAY}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GILGAMESH_GRAY}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GILGAMESH_RED}▄{Colors.GILGAMESH_GRAY}▀▀▀▀▀{Colors.GILGAMESH_RED}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GILGAMESH_RED}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.GILGAMESH_RED}█{Colors.BLACK}▀▀▀{Colors.GILGAMESH_RED}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.GILGAMESH_RED}█{Colors.BLACK} {Colors.GILGAMESH_RED}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Exdeath": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.EXDEATH_BLUE}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EXDEATH_BLUE}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EXDEATH_BLUE}█{Colors.RED}▀{Colors.EXDEATH_BLUE}███{Colors.RED}▀{Colors.EXDEATH_BLUE}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EXDEATH_BLUE}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EXDEATH_PURPLE}▄{Colors.EXDEATH_BLUE}▀▀▀▀▀{Colors.EXDEATH_PURPLE}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.EXDEATH_PURPLE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.EXDEATH_PURPLE}█{Colors.BLACK}▀▀▀{Colors.EXDEATH_PURPLE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.EXDEATH_PURPLE}█{Colors.BLACK} {Colors.EXDEATH_PURPLE}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    
-    # FF4 Characters
-    "Cecil": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.WHITE}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.WHITE}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.WHITE}█{Colors.BLACK}▀{Colors.WHITE}███{Colors.BLACK}▀{Colors.WHITE}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_CYAN}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.BRIGHT_CYAN}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_CYAN}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.BRIGHT_CYAN}█{Colors.BLACK}▀▀▀{Colors.BRIGHT_CYAN}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.BRIGHT_CYAN}█{Colors.BLACK} {Colors.BRIGHT_CYAN}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Golbez": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.GOLBEZ_ARMOR}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GOLBEZ_ARMOR}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GOLBEZ_ARMOR}█{Colors.RED}▀{Colors.GOLBEZ_ARMOR}███{Colors.RED}▀{Colors.GOLBEZ_ARMOR}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GOLBEZ_ARMOR}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GOLBEZ_PURPLE}▄{Colors.GOLBEZ_ARMOR}▀▀▀▀▀{Colors.GOLBEZ_PURPLE}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GOLBEZ_PURPLE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.GOLBEZ_PURPLE}█{Colors.BLACK}▀▀▀{Colors.GOLBEZ_PURPLE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.GOLBEZ_PURPLE}█{Colors.BLACK} {Colors.GOLBEZ_PURPLE}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    
-    # FF1 Characters
-    "Warrior of Light": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.BRIGHT_BLUE}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_BLUE}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_BLUE}█{Colors.BLACK}▀{Colors.BRIGHT_BLUE}███{Colors.BLACK}▀{Colors.BRIGHT_BLUE}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.LOCKE_SKIN}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_CYAN}▄{Colors.LOCKE_SKIN}▀▀▀▀▀{Colors.BRIGHT_CYAN}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.BRIGHT_CYAN}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.BRIGHT_CYAN}█{Colors.BLACK}▀▀▀{Colors.BRIGHT_CYAN}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.BRIGHT_CYAN}█{Colors.BLACK} {Colors.BRIGHT_CYAN}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Garland": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.GARLAND_ARMOR}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GARLAND_ARMOR}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GARLAND_ARMOR}█{Colors.RED}▀{Colors.GARLAND_ARMOR}███{Colors.RED}▀{Colors.GARLAND_ARMOR}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GARLAND_ARMOR}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GARLAND_BLUE}▄{Colors.GARLAND_ARMOR}▀▀▀▀▀{Colors.GARLAND_BLUE}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.GARLAND_BLUE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.GARLAND_BLUE}█{Colors.BLACK}▀▀▀{Colors.GARLAND_BLUE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.GARLAND_BLUE}█{Colors.BLACK} {Colors.GARLAND_BLUE}█{Colors.BLACK}█      {Colors.RESET}"
-    ],
-    "Chaos": [
-        f"{Colors.BLACK}       ▄▄▄▄▄       {Colors.RESET}",
-        f"{Colors.BLACK}     ▄{Colors.CHAOS_RED}▀▀▀▀▀{Colors.BLACK}▄     {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CHAOS_RED}▄▄███▄▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CHAOS_RED}█{Colors.YELLOW}▀{Colors.CHAOS_RED}███{Colors.YELLOW}▀{Colors.CHAOS_RED}█{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CHAOS_RED}▀▀▀▀▀▀▀{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CHAOS_ORANGE}▄{Colors.CHAOS_RED}▀▀▀▀▀{Colors.CHAOS_ORANGE}▄{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}    █{Colors.CHAOS_ORANGE}███████{Colors.BLACK}█    {Colors.RESET}",
-        f"{Colors.BLACK}     ▀{Colors.CHAOS_ORANGE}█{Colors.BLACK}▀▀▀{Colors.CHAOS_ORANGE}█{Colors.BLACK}▀     {Colors.RESET}",
-        f"{Colors.BLACK}      █{Colors.CHAOS_ORANGE}█{Colors.BLACK} {Colors.CHAOS_ORANGE}█{Colors.BLACK}█      {Colors.RESET}"
-    ]
-}
-
-def display_sprite_and_time():
-    # Get current date and time in US format (24-hour)
-    now = datetime.datetime.now()
-    date_time = now.strftime("%m/%d/%Y %H:%M:%S")
-    
-    # Select a random character
-    character_name = random.choice(list(ff_sprites.keys()))
-    sprite = ff_sprites[character_name]
-    
-    # Create FF6-style menu box but with more authentic colors
-    box_width = 40
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "ff6-hyprland")
+IMAGE_DIR = os.path.join(CACHE_DIR, "images")
+CONFIG_DIR = os.path.join(os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config"), "ff6-hyprland")
+ATLAS_DIR = os.path.join(CONFIG_DIR, "sprites")
+INDEX_FILE = os.path.join(CACHE_DIR, "packs.index")
+NAMES_FILE = os.path.join(CACHE_DIR, "packs.names")
+STATE_DIR = os.path.join(os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state"), "ff6-hyprland")
+HISTORY_FILE = os.path.join(STATE_DIR, "recent")
+PROFILE_FILE = os.path.join(STATE_DIR, "profile.jsonl")
+RUNTIME_DIR = os.environ.get("XDG_RUNTIME_DIR") or f"/tmp/ff6-hyprland-{os.getuid()}"
+SOCKET_FILE = os.path.join(RUNTIME_DIR, "ff6-hyprland", "ff_sprite.sock")
+DAEMON_TIMEOUT = 1.0
+
+# Files whose contents decide what a rendered frame looks like
+SOURCE_FILES = (
+    "ff_sprite.py", "ff_sprite_data.py", "ff_sprite_render.py",
+    "ff_sprite_graphics.py", "ff_sprite_color.py", "ff_sprite_packs.py",
+)
+
+# Character modes are named after their color depth
+RENDER_MODES = ("truecolor", "256", "16", "kitty")
+
+# Cache layout: magic, source checksum, frame count, then one
+# (offset, name length, head length, tail length) entry per frame followed by
+# the character name and frame bytes.
+# The date line is spliced in between head and tail at display time.
+CACHE_MAGIC = b"FF6FRM02"
+CACHE_HEADER = ">8sII"
+CACHE_ENTRY = ">IIII"
+
+DATE_FORMAT = "%m/%d/%Y %H:%M:%S"
+DATE_SLOT = "\0" * len("01/01/2025 00:00:00")
+# Marks the cell where the kitty image is placed
+IMAGE_SLOT = "\1"
+BOX_WIDTH = 40
+
+# Launch timings, only collected when FF_SPRITE_PROFILE is set
+profile = None
+
+def mark(phase, **fields):
+    if profile is not None:
+        profile.mark(phase, **fields)
+
+# Color depth from COLORTERM and TERM, asking terminfo only for terminals
+# the names do not give away
+def color_depth():
+    term = os.environ.get("TERM", "")
+    if os.environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+        return "truecolor"
+    if term == "xterm-kitty" or term.endswith("-direct"):
+        return "truecolor"
+    if term.endswith("256color"):
+        return "256"
+    if term in ("linux", "dumb", ""):
+        return "16"
+    from ff_sprite_color import terminfo_depth
+    return terminfo_depth(term)
+
+# Pick the kitty image backend when running in kitty on this machine; over
+# SSH kitty cannot read the image files, so fall back to characters there
+def render_mode():
+    mode = os.environ.get("FF_SPRITE_MODE")
+    if mode in RENDER_MODES:
+        return mode
+    if os.environ.get("TERM") == "xterm-kitty" and not os.environ.get("SSH_CONNECTION"):
+        return "kitty"
+    return color_depth()
+
+def cache_file(mode):
+    return os.path.join(CACHE_DIR, f"ff_sprite-{mode}.frames")
+
+def source_key():
+    import zlib
+    key = 0
+    for name in SOURCE_FILES:
+        with open(os.path.join(SCRIPT_DIR, name), "rb") as f:
+            key = zlib.crc32(f.read(), key)
+    return key
+
+# Padding that centers text of the given visible width inside the box
+def center_padding(width, box_width=BOX_WIDTH):
+    space = box_width - 2 - width
+    return " " * (space // 2), " " * (space - space // 2)
+
+# Build the lines of the FF6-style menu box
+def frame_lines(character_name, sprite, date_time):
+    from ff_sprite_data import Colors
+    from ff_sprite_render import row_width, visible_width
+
+    box_width = BOX_WIDTH
     
     # Top border - using black for border instead of FF6 blue to make sprites stand out
     top_border = f"{Colors.BLACK}╔{'═' * (box_width - 2)}╗{Colors.RESET}"
@@ -312,24 +123,307 @@ def display_sprite_and_time():
     # Bottom border
     bottom_border = f"{Colors.BLACK}╚{'═' * (box_width - 2)}╝{Colors.RESET}"
     
-    # Print the menu box
-    print("\n" + top_border)
+    lines = ["\n" + top_border]
     
-    # Print the sprite with side borders
+    # Sprite with side borders
     for line in sprite:
-        padding = " " * ((box_width - 2 - len(line.strip())) // 2)
-        print(f"{Colors.BLACK}║{Colors.RESET}{padding}{line}{padding}{Colors.BLACK}║{Colors.RESET}")
+        left, right = center_padding(row_width(line), box_width)
+        lines.append(f"{Colors.BLACK}║{Colors.RESET}{left}{line}{right}{Colors.BLACK}║{Colors.RESET}")
+    
+    # Character name with side borders
+    left, right = center_padding(visible_width(character_name), box_width)
+    lines.append(f"{Colors.BLACK}║{Colors.RESET}{left}{Colors.BRIGHT_WHITE}{Colors.BOLD}{character_name}{Colors.RESET}{right}{Colors.BLACK}║{Colors.RESET}")
     
-    # Print character name with side borders
-    name_padding = " " * ((box_width - 2 - len(character_name)) // 2)
-    print(f"{Colors.BLACK}║{Colors.RESET}{name_padding}{Colors.BRIGHT_WHITE}{Colors.BOLD}{character_name}{Colors.RESET}{name_padding}{Colors.BLACK}║{Colors.RESET}")
+    # Date/time with side borders
+    left, right = center_padding(visible_width(date_time), box_width)
+    lines.append(f"{Colors.BLACK}║{Colors.RESET}{left}{Colors.WHITE}{date_time}{Colors.RESET}{right}{Colors.BLACK}║{Colors.RESET}")
+    
+    # Bottom border
+    lines.append(bottom_border + "\n")
+    return lines
+
+# The whole menu box as one string, with redundant escape codes removed
+def render_frame(character_name, sprite, date_time):
+    from ff_sprite_render import minimize_sgr
+
+    return minimize_sgr("\n".join(frame_lines(character_name, sprite, date_time)) + "\n")
+
+def display_sprite_and_time(character_name=None):
+    import datetime
+    from ff_sprite_data import sprite_table
+
+    depth = color_depth()
+    ff_sprites = sprite_table(depth)
+    mark("table", path="inprocess")
+
+    # Get current date and time in US format (24-hour)
+    now = datetime.datetime.now()
+    date_time = now.strftime(DATE_FORMAT)
     
-    # Print date/time with side borders
-    time_padding = " " * ((box_width - 2 - len(date_time)) // 2)
-    print(f"{Colors.BLACK}║{Colors.RESET}{time_padding}{Colors.WHITE}{date_time}{Colors.RESET}{time_padding}{Colors.BLACK}║{Colors.RESET}")
+    # Select a random character unless a known one was asked for
+    sprite = choose_sprite(source_key(), character_name, sprite_games())
+    mark("select")
+    if isinstance(sprite, tuple):
+        head, tail = render_atlas_frame(sprite, depth)
+        write_frame(sys.stdout.fileno(), head, date_time.encode(), tail)
+        return
+    character_name = sprite or tuple(ff_sprites)[int.from_bytes(os.urandom(4), "little") % len(ff_sprites)]
+    sprite = ff_sprites[character_name]
     
-    # Print bottom border
-    print(bottom_border + "\n")
+    # Write the menu box in one go
+    write_frame(sys.stdout.fileno(), render_frame(character_name, sprite, date_time).encode())
+
+# PNG that kitty reads for the image called image_name
+def image_path(image_name):
+    from ff_sprite_graphics import image_id
+
+    return os.path.join(IMAGE_DIR, f"{image_id(image_name):06x}.png")
+
+# Frame with the sprite area left blank and the character's kitty image
+# placed over it. The image is written to IMAGE_DIR first; image and
+# image_name describe sprites that are not in the built-in table.
+def render_kitty_frame(character_name, sprite, date_time, image=None, image_name=None):
+    from ff_sprite_graphics import transmit_command, write_sprite_image
+    from ff_sprite_render import row_width
+
+    image_name = image_name or character_name
+    columns = max(row_width(row) for row in sprite)
+    blank = [IMAGE_SLOT + " " * (columns - 1)] + [" " * columns] * (len(sprite) - 1)
+    path = image_path(image_name)
+    write_sprite_image(character_name, path, image)
+    frame = render_frame(character_name, blank, date_time)
+    return frame.replace(IMAGE_SLOT, transmit_command(image_name, path, columns, len(sprite)) + " ")
+
+# Render a built-in sprite by name, or an atlas sprite, with a placeholder
+# date; returns (head, tail) where the date line goes between the two
+def render_sprite_frame(sprite, mode="truecolor"):
+    from ff_sprite_data import sprite_table
+
+    if isinstance(sprite, tuple):
+        return render_atlas_frame(sprite, mode)
+    if mode == "kitty":
+        os.makedirs(IMAGE_DIR, exist_ok=True)
+        frame = render_kitty_frame(sprite, sprite_table("truecolor")[sprite], DATE_SLOT)
+    else:
+        frame = render_frame(sprite, sprite_table(mode)[sprite], DATE_SLOT)
+    head, tail = frame.encode().split(DATE_SLOT.encode())
+    return head, tail
+
+# Render every built-in sprite, returning (name, head, tail) tuples
+def render_frames(mode="truecolor"):
+    from ff_sprite_data import SPRITE_PALETTES
+
+    return [(character_name.encode(), *render_sprite_frame(character_name, mode)) for character_name in SPRITE_PALETTES]
+
+# Render an atlas sprite (see ff_sprite_atlas.load_sprite) as (head, tail)
+def render_atlas_frame(sprite, mode="truecolor"):
+    from ff_sprite_atlas import sprite_rgba, sprite_rows
+
+    character_name = sprite[0]
+    if mode == "kitty":
+        import zlib
+
+        os.makedirs(IMAGE_DIR, exist_ok=True)
+        # Named after the pixels, so an edited sprite gets a new image
+        image_name = f"atlas:{character_name}:{zlib.crc32(sprite[3] + sprite[4]):08x}"
+        frame = render_kitty_frame(character_name, sprite_rows(sprite), DATE_SLOT, sprite_rgba(sprite), image_name)
+    else:
+        frame = render_frame(character_name, sprite_rows(sprite, mode), DATE_SLOT)
+    head, tail = frame.encode().split(DATE_SLOT.encode())
+    return head, tail
+
+def sprite_games():
+    return tuple(game.strip().lower() for game in os.environ.get("FF_SPRITE_GAMES", "").split(",") if game.strip())
+
+# The sprite called character_name, or a random one from games if it is
+# missing or unknown. Returns a built-in name, an atlas sprite (see
+# ff_sprite_atlas.load_sprite) or None.
+def choose_sprite(key, character_name=None, games=()):
+    from ff_sprite_packs import SpritePacks
+
+    packs = SpritePacks(ATLAS_DIR, INDEX_FILE, NAMES_FILE, HISTORY_FILE)
+    sprite = packs.find(key, character_name) if character_name else None
+    if sprite is None:
+        sprite = packs.pick(key, games)
+    if isinstance(sprite, tuple):
+        from ff_sprite_atlas import load_sprite
+        try:
+            sprite = load_sprite(*sprite)
+        except (OSError, ValueError):
+            # Atlas changed since the index was built
+            sprite = None
+    return sprite
+
+# Store all rendered frames on disk. Returns the cache contents so the caller
+# can use them even when the cache directory is not writable.
+def build_frame_cache(key, mode="truecolor"):
+    import struct
+
+    frames = render_frames(mode)
+    index_size = struct.calcsize(CACHE_HEADER) + struct.calcsize(CACHE_ENTRY) * len(frames)
+    index = [struct.pack(CACHE_HEADER, CACHE_MAGIC, key, len(frames))]
+    offset = index_size
+    for name, head, tail in frames:
+        index.append(struct.pack(CACHE_ENTRY, offset, len(name), len(head), len(tail)))
+        offset += len(name) + len(head) + len(tail)
+    data = b"".join(index) + b"".join(name + head + tail for name, head, tail in frames)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file(mode)}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file(mode))
+    except OSError:
+        pass
+    return data
+
+# Map the frame cache, or return None if it is missing, damaged or stale
+def open_frame_cache(key, mode="truecolor"):
+    import mmap
+    import struct
+
+    try:
+        with open(cache_file(mode), "rb") as f:
+            frames = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    header_size = struct.calcsize(CACHE_HEADER)
+    if len(frames) < header_size:
+        return None
+    magic, cache_key, count = struct.unpack_from(CACHE_HEADER, frames)
+    if magic != CACHE_MAGIC or cache_key != key or count == 0:
+        return None
+    if len(frames) < header_size + struct.calcsize(CACHE_ENTRY) * count:
+        return None
+    if mode == "kitty" and not cached_images_exist(frames, count):
+        return None
+    return frames
+
+# Whether the kitty image of every cached frame is still on disk; the
+# frames are rebuilt, writing the images again, when one was removed
+def cached_images_exist(frames, count):
+    for number in range(count):
+        offset, name_len, _, _ = cached_frame_entry(frames, number)
+        if not os.path.exists(image_path(frames[offset:offset + name_len].decode())):
+            return False
+    return True
+
+def cached_frame_entry(frames, number):
+    import struct
+
+    entry = struct.calcsize(CACHE_HEADER) + struct.calcsize(CACHE_ENTRY) * number
+    return struct.unpack_from(CACHE_ENTRY, frames, entry)
+
+# Number of the cached frame for character_name, or None
+def find_cached_frame(frames, character_name):
+    import struct
+
+    _, _, count = struct.unpack_from(CACHE_HEADER, frames)
+    wanted = character_name.encode()
+    for number in range(count):
+        offset, name_len, _, _ = cached_frame_entry(frames, number)
+        if frames[offset:offset + name_len] == wanted:
+            return number
+    return None
+
+# Pick the frame for character_name, or a random one if no name is given or
+# the name is unknown. Returns (head, tail), as views into frames for
+# built-in sprites.
+def select_cached_frame(frames, character_name=None, mode="truecolor", games=()):
+    import struct
+
+    _, key, count = struct.unpack_from(CACHE_HEADER, frames)
+    sprite = choose_sprite(key, character_name, games)
+    if isinstance(sprite, tuple):
+        return render_atlas_frame(sprite, mode)
+    choice = find_cached_frame(frames, sprite) if sprite else None
+    if choice is None:
+        choice = int.from_bytes(os.urandom(4), "little") % count
+
+    offset, name_len, head_len, tail_len = cached_frame_entry(frames, choice)
+    offset += name_len
+    view = memoryview(frames)
+    return view[offset:offset + head_len], view[offset + head_len:offset + head_len + tail_len]
+
+def write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+# Copy the frame pieces into one preallocated buffer and send it with a
+# single write, instead of one flush per printed line
+def write_frame(fd, *parts):
+    frame = bytearray(sum(len(part) for part in parts))
+    pos = 0
+    for part in parts:
+        frame[pos:pos + len(part)] = part
+        pos += len(part)
+    mark("render")
+    write_all(fd, frame)
+    mark("write", bytes=len(frame))
+
+# Write one pre-rendered frame from the on-disk cache
+def display_cached_frame(character_name=None, mode="truecolor"):
+    key = source_key()
+    frames = open_frame_cache(key, mode)
+    if frames is None:
+        frames = build_frame_cache(key, mode)
+    mark("table", path="cache")
+
+    head, tail = select_cached_frame(frames, character_name, mode, sprite_games())
+    mark("select")
+    write_frame(sys.stdout.fileno(), head, time.strftime(DATE_FORMAT).encode(), tail)
+
+# Ask the resident sprite daemon (ff_sprite_daemon.py) for a frame.
+# Returns False if no daemon is listening.
+def display_daemon_frame(character_name=None, mode="truecolor"):
+    if not os.path.exists(SOCKET_FILE):
+        return False
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(DAEMON_TIMEOUT)
+        try:
+            client.connect(SOCKET_FILE)
+            client.sendall(f"{mode}\t{character_name or ''}\t{','.join(sprite_games())}\n".encode())
+            frame = b""
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                frame += chunk
+        except OSError:
+            return False
+    if not frame:
+        return False
+    mark("daemon", path="daemon")
+    write_all(sys.stdout.fileno(), frame)
+    mark("write", bytes=len(frame))
+    return True
 
 if __name__ == "__main__":
-    display_sprite_and_time()
+    character_name = " ".join(sys.argv[1:]) or None
+    if os.environ.get("FF_SPRITE_ANIMATE", "0") not in ("", "0"):
+        # Idling sprite instead of a still frame
+        from ff_sprite_anim import animate
+        animate(character_name)
+        sys.exit(0)
+    if os.environ.get("FF_SPRITE_PROFILE", "0") not in ("", "0"):
+        from ff_sprite_profile import LaunchProfile
+        profile = LaunchProfile()
+    mode = render_mode()
+    mark("detect")
+    try:
+        if not display_daemon_frame(character_name, mode):
+            mark("daemon")
+            display_cached_frame(character_name, mode)
+    except (OSError, ValueError):
+        # Fall back to rendering in-process if the cache cannot be used
+        display_sprite_and_time(character_name)
+    if profile is not None:
+        profile_file = os.environ["FF_SPRITE_PROFILE"]
+        try:
+            profile.save(profile_file if profile_file != "1" else PROFILE_FILE, mode=mode, name=character_name)
+        except OSError:
+            pass
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# Animated Final Fantasy Sprite for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+#
+# Shows the usual menu box with the character idling and a ticking clock.
+# Frames are produced by a fixed-rate scheduler that sleeps between ticks,
+# and only the cells that changed since the previous frame are rewritten.
+# Ticking pauses while the window is unfocused (focus reporting) and the
+# animation ends on the first keypress, SIGINT or SIGWINCH. A single still
+# frame is written instead when stdin or stdout is not a tty (no keypress
+# could end it), for atlas sprites (they have no idle frames) and in kitty
+# mode (the sprite is a static image).
+#
+# Enabled for new windows with FF_SPRITE_ANIMATE=1, which ff_sprite.py and
+# ff_sprite_client.sh hand over to this script.
+#
+# Usage: ff_sprite_anim.py [character name]
+
+import os
+import select
+import signal
+import sys
+import time
+
+import ff_sprite
+from ff_sprite_data import SPRITE_PALETTES, sprite_animation
+from ff_sprite_render import DEFAULT_STYLE, frame_cells, transition
+
+FPS = 2
+
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+SAVE_CURSOR = "\0337"
+RESTORE_CURSOR = "\0338"
+FOCUS_REPORTING_ON = "\033[?1004h"
+FOCUS_REPORTING_OFF = "\033[?1004l"
+FOCUS_IN = b"\033[I"
+FOCUS_OUT = b"\033[O"
+
+class StopAnimation(Exception):
+    pass
+
+def stop_animation(signum, frame):
+    raise StopAnimation
+
+# Escape sequences that turn the cells of old into those of new. Positions
+# are relative to the saved cursor, which rests on the last row.
+def redraw_changes(old, new):
+    out = []
+    style = DEFAULT_STYLE
+    bottom = len(new) - 1
+    for y, new_row in enumerate(new):
+        old_row = old[y] if y < len(old) else []
+        x = 0
+        while x < len(new_row):
+            if x < len(old_row) and old_row[x] == new_row[x]:
+                x += 1
+                continue
+            up = f"\033[{bottom - y}A" if bottom > y else ""
+            out.append(f"{RESTORE_CURSOR}{up}\033[{x + 1}G")
+            while x < len(new_row) and (x >= len(old_row) or old_row[x] != new_row[x]):
+                char, cell_style = new_row[x]
+                if cell_style != style:
+                    out.append(transition(style, cell_style))
+                    style = cell_style
+                out.append(char)
+                x += 1
+    if not out:
+        return ""
+    if style != DEFAULT_STYLE:
+        out.append("\033[0m")
+    out.append(RESTORE_CURSOR)
+    return "".join(out)
+
+# Apply focus reports in data; returns (focused, other input seen)
+def read_focus(data, focused):
+    focus_in, focus_out = data.rfind(FOCUS_IN), data.rfind(FOCUS_OUT)
+    if focus_in != focus_out:
+        # The later report wins
+        focused = focus_in > focus_out
+    rest = data.replace(FOCUS_IN, b"").replace(FOCUS_OUT, b"")
+    return focused, bool(rest)
+
+def animate(character_name=None, mode=None):
+    mode = mode or ff_sprite.render_mode()
+    sprite = ff_sprite.choose_sprite(ff_sprite.source_key(), character_name, ff_sprite.sprite_games())
+    if sprite is None:
+        sprite = tuple(SPRITE_PALETTES)[int.from_bytes(os.urandom(4), "little") % len(SPRITE_PALETTES)]
+    in_fd, out_fd = sys.stdin.fileno(), sys.stdout.fileno()
+    if not os.isatty(in_fd) or not os.isatty(out_fd) or isinstance(sprite, tuple) or mode == "kitty":
+        head, tail = ff_sprite.render_sprite_frame(sprite, mode)
+        ff_sprite.write_frame(out_fd, head, time.strftime(ff_sprite.DATE_FORMAT).encode(), tail)
+        return
+
+    character_name = sprite
+    # Character modes are named after their color depth
+    frames = sprite_animation(character_name, mode)
+
+    import termios
+    import tty
+
+    saved_tty = termios.tcgetattr(in_fd)
+    tty.setcbreak(in_fd)
+
+    signal.signal(signal.SIGWINCH, stop_animation)
+    signal.signal(signal.SIGINT, stop_animation)
+
+    frame = ff_sprite.render_frame(character_name, frames[0], time.strftime(ff_sprite.DATE_FORMAT))
+    previous = frame_cells(frame)
+    setup = HIDE_CURSOR + FOCUS_REPORTING_ON + frame + SAVE_CURSOR
+    ff_sprite.write_all(out_fd, setup.encode())
+
+    focused = True
+    start = time.monotonic()
+    tick = 0
+    try:
+        while True:
+            if focused:
+                deadline = start + (tick + 1) / FPS
+                timeout = max(0.0, deadline - time.monotonic())
+            else:
+                # Nothing to draw until focus comes back
+                timeout = None
+            ready, _, _ = select.select([in_fd], [], [], timeout)
+            if ready:
+                data = os.read(in_fd, 64)
+                was_focused = focused
+                focused, pressed = read_focus(data, focused)
+                if pressed or not data:
+                    break
+                if focused and not was_focused:
+                    start = time.monotonic()
+                    tick = 0
+                continue
+
+            tick += 1
+            # Skip ticks missed while suspended instead of replaying them
+            behind = int((time.monotonic() - start) * FPS) - tick
+            if behind > 0:
+                tick += behind
+
+            frame = ff_sprite.render_frame(character_name, frames[tick % len(frames)], time.strftime(ff_sprite.DATE_FORMAT))
+            cells = frame_cells(frame)
+            changes = redraw_changes(previous, cells)
+            if changes:
+                ff_sprite.write_all(out_fd, changes.encode())
+            previous = cells
+    except StopAnimation:
+        pass
+    finally:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        restore = FOCUS_REPORTING_OFF + SHOW_CURSOR + "\033[0m"
+        ff_sprite.write_all(out_fd, restore.encode())
+        termios.tcsetattr(in_fd, termios.TCSADRAIN, saved_tty)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+if __name__ == "__main__":
+    animate(" ".join(sys.argv[1:]) or None)
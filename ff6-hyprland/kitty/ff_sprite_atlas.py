@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# Final Fantasy Sprite Atlas Importer for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+#
+# Cuts PNG sprite sheets into cells and stores them in a compact atlas that
+# ff_sprite.py can draw from. Sheets are streamed with the standard library
+# only: IDAT data is inflated and unfiltered one row at a time, and only one
+# band of cells is held in memory. Each cell is quantized to a small palette.
+#
+# Atlas layout: header (magic, sprite count, index offset), the sprite
+# records, then a fixed-size index entry per sprite. Readers seek straight to
+# the entry they need, so loading one sprite costs the same for any atlas size.
+#
+# Usage: ff_sprite_atlas.py --cell 16x24 [--names A,B,...] [-o out.atlas] SHEET.png...
+
+import os
+import struct
+import sys
+import zlib
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+ATLAS_MAGIC = b"FF6ATL01"
+ATLAS_HEADER = ">8sII"
+# Record offset, record length and NUL-padded UTF-8 name
+ATLAS_ENTRY = ">II32s"
+# Width, height and palette size, followed by the RGB palette and the
+# zlib-compressed pixels (one palette index per pixel, 0 is transparent)
+RECORD_HEADER = ">HHB"
+
+# Widest sprite that fits inside the menu box
+MAX_WIDTH = 38
+
+# Bytes of image data inflated at a time, at least one scanline
+INFLATE_LIMIT = 65536
+
+# Samples per pixel for each PNG color type
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+def read_chunk_header(f):
+    header = f.read(8)
+    if len(header) < 8:
+        raise ValueError("truncated PNG")
+    return struct.unpack(">I4s", header)
+
+# Read the signature and IHDR chunk; returns the image parameters
+def read_png_header(f):
+    if f.read(8) != PNG_SIGNATURE:
+        raise ValueError("not a PNG file")
+    length, kind = read_chunk_header(f)
+    if kind != b"IHDR":
+        raise ValueError("PNG does not start with IHDR")
+    width, height, bit_depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", f.read(length))
+    f.read(4)
+    if color_type not in PNG_CHANNELS:
+        raise ValueError(f"unsupported PNG color type {color_type}")
+    if interlace:
+        raise ValueError("interlaced PNGs are not supported")
+    if bit_depth != 8 and not (color_type == 3 and bit_depth in (1, 2, 4)):
+        raise ValueError(f"unsupported PNG bit depth {bit_depth}")
+    return {"width": width, "height": height, "bit_depth": bit_depth, "color_type": color_type}
+
+def paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+# Undo the PNG filter of one scanline in place
+def unfilter(filter_type, row, previous, bpp):
+    if filter_type == 1:
+        for i in range(bpp, len(row)):
+            row[i] = (row[i] + row[i - bpp]) & 0xFF
+    elif filter_type == 2:
+        for i in range(len(row)):
+            row[i] = (row[i] + previous[i]) & 0xFF
+    elif filter_type == 3:
+        for i in range(len(row)):
+            left = row[i - bpp] if i >= bpp else 0
+            row[i] = (row[i] + ((left + previous[i]) >> 1)) & 0xFF
+    elif filter_type == 4:
+        for i in range(len(row)):
+            left = row[i - bpp] if i >= bpp else 0
+            upper_left = previous[i - bpp] if i >= bpp else 0
+            row[i] = (row[i] + paeth(left, previous[i], upper_left)) & 0xFF
+    elif filter_type != 0:
+        raise ValueError(f"bad PNG filter type {filter_type}")
+
+# Convert one unfiltered scanline to RGBA
+def scanline_rgba(row, info, palette, transparency):
+    width, color_type = info["width"], info["color_type"]
+    if color_type == 6:
+        return bytes(row)
+    out = bytearray(width * 4)
+    if color_type == 3:
+        bits = info["bit_depth"]
+        per_byte = 8 // bits
+        mask = (1 << bits) - 1
+        for x in range(width):
+            index = (row[x // per_byte] >> (8 - bits * (x % per_byte + 1))) & mask
+            out[x * 4:x * 4 + 3] = palette[index * 3:index * 3 + 3]
+            out[x * 4 + 3] = transparency[index] if index < len(transparency) else 255
+    elif color_type == 2:
+        key = bytes(transparency[1::2]) if len(transparency) == 6 else None
+        for x in range(width):
+            rgb = row[x * 3:x * 3 + 3]
+            out[x * 4:x * 4 + 3] = rgb
+            out[x * 4 + 3] = 0 if rgb == key else 255
+    elif color_type == 0:
+        key = transparency[1] if len(transparency) == 2 else None
+        for x in range(width):
+            out[x * 4:x * 4 + 3] = bytes((row[x],)) * 3
+            out[x * 4 + 3] = 0 if row[x] == key else 255
+    else:
+        for x in range(width):
+            out[x * 4:x * 4 + 3] = bytes((row[x * 2],)) * 3
+            out[x * 4 + 3] = row[x * 2 + 1]
+    return bytes(out)
+
+# Yield the image as RGBA rows, inflating and unfiltering as data arrives
+def iter_png_rows(f, info):
+    channels = PNG_CHANNELS[info["color_type"]]
+    bpp = max(1, channels * info["bit_depth"] // 8)
+    stride = (info["width"] * channels * info["bit_depth"] + 7) // 8
+    decompressor = zlib.decompressobj()
+    limit = max(stride + 1, INFLATE_LIMIT)
+    pending = bytearray()
+    previous = bytearray(stride)
+    palette = b""
+    transparency = b""
+    rows_left = info["height"]
+    while rows_left:
+        length, kind = read_chunk_header(f)
+        if kind != b"IDAT":
+            data = f.read(length)
+            f.read(4)
+            if kind == b"PLTE":
+                palette = data
+            elif kind == b"tRNS":
+                transparency = data
+            elif kind == b"IEND":
+                raise ValueError("PNG ended before all rows were read")
+            continue
+        remaining = length
+        while remaining:
+            data = f.read(min(remaining, 65536))
+            if not data:
+                raise ValueError("truncated PNG")
+            remaining -= len(data)
+            # Inflate a bounded amount at a time, so a small chunk of a highly
+            # compressed image never expands all at once
+            while True:
+                inflated = decompressor.decompress(data, limit)
+                data = decompressor.unconsumed_tail
+                pending += inflated
+                while rows_left and len(pending) > stride:
+                    filter_type = pending[0]
+                    row = pending[1:stride + 1]
+                    del pending[:stride + 1]
+                    unfilter(filter_type, row, previous, bpp)
+                    previous = row
+                    rows_left -= 1
+                    yield scanline_rgba(row, info, palette, transparency)
+                if not data and len(inflated) < limit:
+                    break
+        f.read(4)
+
+# Map a cell's RGBA pixels to palette indices, keeping at most max_colors of
+# the most common opaque colors and folding the rest into their nearest match
+def quantize_cell(pixels, max_colors):
+    counts = {}
+    for i in range(0, len(pixels), 4):
+        if pixels[i + 3] >= 128:
+            rgb = pixels[i:i + 3]
+            counts[rgb] = counts.get(rgb, 0) + 1
+    palette = sorted(counts, key=counts.get, reverse=True)[:max_colors]
+    lookup = {rgb: index + 1 for index, rgb in enumerate(palette)}
+    for rgb in counts:
+        if rgb not in lookup:
+            lookup[rgb] = 1 + min(range(len(palette)), key=lambda i: sum((a - b) ** 2 for a, b in zip(rgb, palette[i])))
+    indices = bytearray(len(pixels) // 4)
+    for i in range(len(indices)):
+        if pixels[i * 4 + 3] >= 128:
+            indices[i] = lookup[pixels[i * 4:i * 4 + 3]]
+    return b"".join(palette), bytes(indices)
+
+# Yield (width, height, RGBA pixels) for every non-empty cell of a sheet,
+# holding only one band of cell rows at a time
+def iter_sheet_cells(path, cell_width, cell_height):
+    with open(path, "rb") as f:
+        info = read_png_header(f)
+        columns = info["width"] // cell_width
+        band = []
+        for row in iter_png_rows(f, info):
+            band.append(row)
+            if len(band) < cell_height:
+                continue
+            for column in range(columns):
+                start = column * cell_width * 4
+                pixels = b"".join(band_row[start:start + cell_width * 4] for band_row in band)
+                if any(pixels[3::4]):
+                    yield cell_width, cell_height, pixels
+            band = []
+
+def encode_record(width, height, palette, indices):
+    return struct.pack(RECORD_HEADER, width, height, len(palette) // 3) + palette + zlib.compress(indices, 9)
+
+# Import sheets into a new atlas at output; returns the number of sprites
+def import_sheets(sheets, cell_width, cell_height, output, names=(), max_colors=15):
+    if cell_width <= 0 or cell_height <= 0:
+        raise ValueError("cell size must be positive")
+    if cell_width > MAX_WIDTH:
+        raise ValueError(f"cells wider than {MAX_WIDTH} pixels do not fit the menu box")
+    names = list(names)
+    index = []
+    tmp_file = f"{output}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    try:
+        with open(tmp_file, "wb") as atlas:
+            atlas.write(struct.pack(ATLAS_HEADER, ATLAS_MAGIC, 0, 0))
+            for sheet in sheets:
+                stem = os.path.splitext(os.path.basename(sheet))[0]
+                for number, (width, height, pixels) in enumerate(iter_sheet_cells(sheet, cell_width, cell_height), 1):
+                    name = names.pop(0) if names else f"{stem} {number}"
+                    palette, indices = quantize_cell(pixels, max_colors)
+                    record = encode_record(width, height, palette, indices)
+                    index.append(struct.pack(ATLAS_ENTRY, atlas.tell(), len(record), name.encode()[:32]))
+                    atlas.write(record)
+            index_offset = atlas.tell()
+            atlas.write(b"".join(index))
+            atlas.seek(0)
+            atlas.write(struct.pack(ATLAS_HEADER, ATLAS_MAGIC, len(index), index_offset))
+        os.replace(tmp_file, output)
+    except BaseException:
+        # Leave no half-written atlas behind in the sprite directory
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+    return len(index)
+
+# Number of sprites in an atlas and the offset of its index
+def read_atlas_header(f):
+    magic, count, index_offset = struct.unpack(ATLAS_HEADER, f.read(struct.calcsize(ATLAS_HEADER)))
+    if magic != ATLAS_MAGIC:
+        raise ValueError("not a sprite atlas")
+    return count, index_offset
+
+def entry_name(raw_name):
+    return raw_name.rstrip(b"\0").decode("utf-8", "replace")
+
+# Names of every sprite in an atlas, in order
+def atlas_names(path):
+    entry_size = struct.calcsize(ATLAS_ENTRY)
+    with open(path, "rb") as f:
+        count, index_offset = read_atlas_header(f)
+        f.seek(index_offset)
+        entries = f.read(entry_size * count)
+    return [entry_name(entries[i * entry_size + 8:(i + 1) * entry_size]) for i in range(count)]
+
+# Read the sprite at position number, or the one called name.
+# Returns (name, width, height, palette, pixels) or None.
+def load_sprite(path, number=None, name=None):
+    entry_size = struct.calcsize(ATLAS_ENTRY)
+    with open(path, "rb") as f:
+        count, index_offset = read_atlas_header(f)
+        if name is not None:
+            f.seek(index_offset)
+            entries = f.read(entry_size * count)
+            wanted = name.encode()[:32]
+            number = next((i for i in range(count) if entries[i * entry_size + 8:(i + 1) * entry_size].rstrip(b"\0") == wanted), None)
+        if number is None or not 0 <= number < count:
+            return None
+        f.seek(index_offset + entry_size * number)
+        offset, length, raw_name = struct.unpack(ATLAS_ENTRY, f.read(entry_size))
+        f.seek(offset)
+        record = f.read(length)
+    header_size = struct.calcsize(RECORD_HEADER)
+    width, height, colors = struct.unpack_from(RECORD_HEADER, record)
+    palette = record[header_size:header_size + colors * 3]
+    pixels = zlib.decompress(record[header_size + colors * 3:])
+    return entry_name(raw_name), width, height, palette, pixels
+
+# ANSI rows for an atlas sprite, two pixel rows per text row
+def sprite_rows(sprite, depth="truecolor"):
+    from ff_sprite_color import quantize_sgr
+
+    _, width, height, palette, pixels = sprite
+    colors = [tuple(palette[i:i + 3]) for i in range(0, len(palette), 3)]
+    fg = [None] + [quantize_sgr("\033[38;2;%d;%d;%dm" % rgb, depth) for rgb in colors]
+    bg = [None] + [quantize_sgr("\033[48;2;%d;%d;%dm" % rgb, depth) for rgb in colors]
+    rows = []
+    for y in range(0, height, 2):
+        parts = []
+        for x in range(width):
+            top = pixels[y * width + x]
+            bottom = pixels[(y + 1) * width + x] if y + 1 < height else 0
+            if not top and not bottom:
+                parts.append("\033[0m ")
+            elif top == bottom:
+                parts.append(f"\033[49m{fg[top]}█")
+            elif not bottom:
+                parts.append(f"\033[49m{fg[top]}▀")
+            elif not top:
+                parts.append(f"\033[49m{fg[bottom]}▄")
+            else:
+                parts.append(f"{fg[top]}{bg[bottom]}▀")
+        parts.append("\033[0m")
+        rows.append("".join(parts))
+    return rows
+
+# RGBA pixels of an atlas sprite, for the kitty image backend
+def sprite_rgba(sprite):
+    _, width, height, palette, pixels = sprite
+    colors = [b"\0\0\0\0"] + [palette[i:i + 3] + b"\xff" for i in range(0, len(palette), 3)]
+    return width, height, b"".join(colors[index] for index in pixels)
+
+def main():
+    import argparse
+
+    import ff_sprite
+
+    parser = argparse.ArgumentParser(description="Import PNG sprite sheets into a sprite atlas.")
+    parser.add_argument("sheets", nargs="+", metavar="SHEET.png")
+    parser.add_argument("--cell", required=True, metavar="WxH", help="cell size in pixels, e.g. 16x24")
+    parser.add_argument("--names", default="", help="comma-separated names for the non-empty cells, in order")
+    parser.add_argument("--colors", type=int, default=15, help="opaque colors per sprite (default: 15)")
+    parser.add_argument("-o", "--output", help=f"atlas to write (default: {ff_sprite.ATLAS_DIR}/<first sheet>.atlas)")
+    args = parser.parse_args()
+
+    try:
+        cell_width, cell_height = (int(value) for value in args.cell.lower().split("x"))
+    except ValueError:
+        parser.error("--cell must look like 16x24")
+    if cell_width <= 0 or cell_height <= 0:
+        parser.error("--cell must be a positive size")
+    output = args.output or os.path.join(ff_sprite.ATLAS_DIR, os.path.splitext(os.path.basename(args.sheets[0]))[0] + ".atlas")
+    names = [name.strip() for name in args.names.split(",") if name.strip()]
+    try:
+        count = import_sheets(args.sheets, cell_width, cell_height, output, names, min(max(args.colors, 1), 255))
+    except (OSError, ValueError, zlib.error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"Imported {count} sprites into {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# Final Fantasy Sprite Benchmark for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+#
+# Measures, for every sprite in ff_sprites:
+#   cold_ms   wall time of ff_sprite.py in a fresh process (median of --runs),
+#             served from a warm frame cache as in a new kitty window
+#   warm_us   time per in-process frame in a loop (--loops, fastest of
+#             WARM_BATCHES batches), writing to /dev/null or, with --pty, to
+#             a pseudo-terminal: display_sprite_and_time() in character
+#             modes, the kitty image frame in kitty mode
+#   bytes     size of the frame ff_sprite.py writes
+# and prints the results as JSON. Runs use scratch cache, state and runtime
+# directories, so the daemon and the user's sprite history stay out of it.
+#
+# Results are compared with a stored baseline, one per mode and output, and
+# the exit status is 1 when any sprite got slower or bigger by more than
+# --threshold percent. Cold starts barely depend on the sprite and are noisy,
+# so only their median over all sprites is compared. The first run for a
+# mode and output, or --update-baseline, stores the baseline.
+#
+# Usage: ff_sprite_bench.py [--runs N] [--loops N] [--mode MODE] [--pty]
+#                           [--baseline FILE] [--threshold PCT] [-o FILE]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATE_DIR = os.path.join(os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state"), "ff6-hyprland")
+
+WARM_BATCHES = 5
+
+# Metrics compared per sprite; cold_ms is compared as the overall median
+SPRITE_METRICS = ("warm_us", "bytes")
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2
+
+# Environment pointing every ff_sprite directory at scratch space
+def bench_env(scratch, mode):
+    env = dict(os.environ)
+    for name in ("XDG_CACHE_HOME", "XDG_CONFIG_HOME", "XDG_STATE_HOME", "XDG_RUNTIME_DIR"):
+        env[name] = os.path.join(scratch, name.lower())
+        os.makedirs(env[name], exist_ok=True)
+    env.pop("FF_SPRITE_PROFILE", None)
+    env.pop("FF_SPRITE_GAMES", None)
+    env["FF_SPRITE_MODE"] = mode
+    # display_sprite_and_time() follows the terminal's color depth
+    env["COLORTERM"] = "truecolor" if mode in ("truecolor", "kitty") else ""
+    env["TERM"] = {"256": "xterm-256color", "16": "linux"}.get(mode, "xterm-kitty")
+    return env
+
+# (median wall time in ms, bytes written) of running ff_sprite.py afresh
+def cold_start(character_name, env, runs):
+    script = os.path.join(SCRIPT_DIR, "ff_sprite.py")
+    output = subprocess.run([sys.executable, script, character_name], env=env, stdout=subprocess.PIPE, check=True).stdout
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, script, character_name], env=env, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return median(times), len(output)
+
+# Point stdout at /dev/null or a drained pty while running the warm loops
+class RedirectStdout:
+    def __init__(self, use_pty=False):
+        self.use_pty = use_pty
+
+    def __enter__(self):
+        sys.stdout.flush()
+        self.saved = os.dup(1)
+        if self.use_pty:
+            import threading
+
+            self.master, target = os.openpty()
+            self.reader = threading.Thread(target=self.drain, daemon=True)
+            self.reader.start()
+        else:
+            target = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(target, 1)
+        os.close(target)
+        return self
+
+    def drain(self):
+        try:
+            while os.read(self.master, 65536):
+                pass
+        except OSError:
+            pass
+
+    def __exit__(self, *exc):
+        os.dup2(self.saved, 1)
+        os.close(self.saved)
+        if self.use_pty:
+            # Closing the last slave end makes the reader see EOF/EIO
+            self.reader.join(1.0)
+            os.close(self.master)
+
+def baseline_file(mode, output):
+    return os.path.join(STATE_DIR, f"bench-baseline-{mode}-{output}.json")
+
+# Write one frame in-process the way mode draws it. display_sprite_and_time()
+# follows the color depth set up by bench_env() and never draws kitty images.
+def warm_frame(ff_sprite, character_name, mode):
+    if mode == "kitty":
+        head, tail = ff_sprite.render_sprite_frame(character_name, mode)
+        ff_sprite.write_frame(sys.stdout.fileno(), head, time.strftime(ff_sprite.DATE_FORMAT).encode(), tail)
+    else:
+        ff_sprite.display_sprite_and_time(character_name)
+
+# Time per warm frame in microseconds. The loops are split into batches and
+# the fastest one counts, which keeps scheduler noise out of the comparison.
+def warm_render(ff_sprite, character_name, loops, mode, use_pty):
+    batch = max(loops // WARM_BATCHES, 1)
+    best = None
+    with RedirectStdout(use_pty):
+        warm_frame(ff_sprite, character_name, mode)
+        for _ in range(WARM_BATCHES):
+            start = time.perf_counter()
+            for _ in range(batch):
+                warm_frame(ff_sprite, character_name, mode)
+            elapsed = (time.perf_counter() - start) / batch
+            best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6
+
+def run_benchmark(runs, loops, mode, use_pty):
+    with tempfile.TemporaryDirectory(prefix="ff_sprite_bench.") as scratch:
+        env = bench_env(scratch, mode)
+        # ff_sprite reads its directories from the environment on import
+        os.environ.update(env)
+        sys.path.insert(0, SCRIPT_DIR)
+        import ff_sprite
+        from ff_sprite_data import ff_sprites
+
+        sprites = {}
+        for character_name in ff_sprites:
+            cold_ms, size = cold_start(character_name, env, runs)
+            warm_us = warm_render(ff_sprite, character_name, loops, mode, use_pty)
+            sprites[character_name] = {"cold_ms": round(cold_ms, 3), "warm_us": round(warm_us, 3), "bytes": size}
+    return {
+        "python": sys.version.split()[0],
+        "mode": mode,
+        "output": "pty" if use_pty else "devnull",
+        "runs": runs,
+        "loops": loops,
+        "cold_ms": round(median(sprite["cold_ms"] for sprite in sprites.values()), 3),
+        "sprites": sprites,
+    }
+
+# Descriptions of every metric that regressed by more than threshold percent
+def regressions(results, baseline, threshold):
+    limit = 1 + threshold / 100
+    found = []
+    if results["cold_ms"] > baseline["cold_ms"] * limit:
+        found.append(f"cold start: {baseline['cold_ms']:.2f} -> {results['cold_ms']:.2f} ms")
+    for character_name, metrics in results["sprites"].items():
+        base = baseline["sprites"].get(character_name)
+        if base is None:
+            continue
+        for metric in SPRITE_METRICS:
+            if metrics[metric] > base[metric] * limit:
+                found.append(f"{character_name} {metric}: {base[metric]} -> {metrics[metric]}")
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ff_sprite.py for every sprite.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per sprite (default: 5)")
+    parser.add_argument("--loops", type=int, default=200, help="warm calls per sprite (default: 200)")
+    parser.add_argument("--mode", default="truecolor", choices=("truecolor", "256", "16", "kitty"))
+    parser.add_argument("--pty", action="store_true", help="write warm frames to a pty instead of /dev/null")
+    parser.add_argument("--baseline", help=f"baseline to compare with (default: {baseline_file('MODE', 'OUTPUT')})")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=25.0, help="allowed slowdown or growth in percent (default: 25)")
+    parser.add_argument("-o", "--output", help="write the JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        results = run_benchmark(max(args.runs, 1), max(args.loops, 1), args.mode, args.pty)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    report = json.dumps(results, indent=2) + "\n"
+    args.baseline = args.baseline or baseline_file(results["mode"], results["output"])
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            f.write(report)
+    else:
+        sys.stdout.write(report)
+
+    baseline = None
+    if not args.update_baseline:
+        try:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error: cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 1
+    if baseline is None:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            f.write(report)
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+    if (baseline.get("mode"), baseline.get("output")) != (results["mode"], results["output"]):
+        print(f"Error: baseline {args.baseline} was taken with --mode {baseline.get('mode')} and {baseline.get('output')} output; "
+              "pass another --baseline or --update-baseline", file=sys.stderr)
+        return 1
+
+    found = regressions(results, baseline, args.threshold)
+    for regression in found:
+        print(f"Regression: {regression}", file=sys.stderr)
+    if found:
+        return 1
+    print(f"No regressions over {args.threshold:g}% against {args.baseline}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/bin/sh
+# Thin client for the Final Fantasy sprite daemon
+# Part of FF6 Hyprland Configuration
+#
+# Asks ff_sprite_daemon.py for a frame without starting Python; usage:
+#   ff_sprite_client.sh [character name]
+# Falls back to ff_sprite.py when the daemon or socat is not available.
+
+SOCKET_FILE="${XDG_RUNTIME_DIR:-/tmp/ff6-hyprland-$(id -u)}/ff6-hyprland/ff_sprite.sock"
+
+# Same backend choice as render_mode() in ff_sprite.py
+if [ -n "$FF_SPRITE_MODE" ]; then
+    MODE="$FF_SPRITE_MODE"
+elif [ "$TERM" = "xterm-kitty" ] && [ -z "$SSH_CONNECTION" ]; then
+    MODE="kitty"
+else
+    # Same checks as color_depth() in ff_sprite.py; COLORTERM is matched
+    # case-insensitively and terminfo may announce direct color with RGB
+    case "$COLORTERM" in
+        [Tt][Rr][Uu][Ee][Cc][Oo][Ll][Oo][Rr]|24[Bb][Ii][Tt]) MODE="truecolor" ;;
+        *)
+            case "$TERM" in
+                xterm-kitty|*-direct) MODE="truecolor" ;;
+                *256color) MODE="256" ;;
+                linux|dumb|"") MODE="16" ;;
+                *)
+                    COLORS=$(tput colors 2> /dev/null || echo 0)
+                    if tput RGB > /dev/null 2>&1 || [ "${COLORS:-0}" -ge 16777216 ]; then
+                        MODE="truecolor"
+                    elif [ "${COLORS:-0}" -ge 256 ]; then
+                        MODE="256"
+                    else
+                        MODE="16"
+                    fi
+                    ;;
+            esac
+            ;;
+    esac
+fi
+
+# The idle animation runs in ff_sprite.py's process, not the daemon's, and
+# launch profiling needs ff_sprite.py to run (it still asks the daemon)
+case "${FF_SPRITE_ANIMATE:-0}${FF_SPRITE_PROFILE:-0}" in
+    00) ;;
+    *) exec python3 "$(dirname "$0")/ff_sprite.py" "$@" ;;
+esac
+
+if [ -S "$SOCKET_FILE" ] && command -v socat > /dev/null 2>&1; then
+    # The daemon closes without sending anything when it fails to render, so
+    # only an actual frame counts. The trailing "x" keeps the frame's final
+    # newlines from being stripped by the command substitution.
+    FRAME=$(printf '%s\t%s\t%s\n' "$MODE" "$*" "$FF_SPRITE_GAMES" | socat -t 1 - "UNIX-CONNECT:$SOCKET_FILE" 2> /dev/null; echo x)
+    if [ "$FRAME" != "x" ]; then
+        printf '%s' "${FRAME%x}"
+        exit 0
+    fi
+fi
+
+exec python3 "$(dirname "$0")/ff_sprite.py" "$@"
@@ -0,0 +1,100 @@
+# Final Fantasy Sprite Color Depth Support for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+#
+# The sprite palettes are written as 24-bit "38;2;r;g;b" sequences. On
+# terminals without truecolor (the Linux console, many tmux setups) they are
+# quantized to the nearest xterm-256 or 16-color entry through precomputed
+# lookup tables; each palette color is quantized once per depth.
+
+import os
+
+COLOR_DEPTHS = ("truecolor", "256", "16")
+
+# Default xterm values of the 16 base colors
+XTERM_16 = (
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+    (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+)
+
+# Channel levels of the 6x6x6 color cube (indices 16-231)
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+# Channel value -> index of the nearest cube level
+CUBE_INDEX = bytes(min(range(6), key=lambda i: abs(CUBE_LEVELS[i] - v)) for v in range(256))
+
+# Gray value -> nearest step of the 24-step gray ramp (indices 232-255)
+GRAY_INDEX = bytes(min(range(24), key=lambda i: abs(8 + 10 * i - v)) for v in range(256))
+
+# Channel value -> 4-bit bucket of the 16-color table
+BUCKET = bytes((v * 15 + 127) // 255 for v in range(256))
+
+_table_16 = None
+_quantized = {}
+
+def distance(a, b):
+    dr, dg, db = a[0] - b[0], a[1] - b[1], a[2] - b[2]
+    return 2 * dr * dr + 4 * dg * dg + 3 * db * db
+
+def nearest_16(rgb):
+    return min(range(16), key=lambda i: distance(rgb, XTERM_16[i]))
+
+# 4096-entry table over 4-bit RGB buckets, built the first time it is needed
+def table_16():
+    global _table_16
+    if _table_16 is None:
+        _table_16 = bytes(
+            nearest_16((r * 17, g * 17, b * 17))
+            for r in range(16) for g in range(16) for b in range(16)
+        )
+    return _table_16
+
+def rgb_to_16(r, g, b):
+    return table_16()[BUCKET[r] << 8 | BUCKET[g] << 4 | BUCKET[b]]
+
+def rgb_to_256(r, g, b):
+    cube = (CUBE_LEVELS[CUBE_INDEX[r]], CUBE_LEVELS[CUBE_INDEX[g]], CUBE_LEVELS[CUBE_INDEX[b]])
+    gray_step = GRAY_INDEX[(r + g + b) // 3]
+    gray = (8 + 10 * gray_step,) * 3
+    if distance((r, g, b), gray) < distance((r, g, b), cube):
+        return 232 + gray_step
+    return 16 + 36 * CUBE_INDEX[r] + 6 * CUBE_INDEX[g] + CUBE_INDEX[b]
+
+# Rewrite a foreground or background SGR color sequence for the given depth
+def quantize_sgr(sgr, depth):
+    if depth == "truecolor" or sgr[2:7] not in ("38;2;", "48;2;"):
+        return sgr
+    quantized = _quantized.get((sgr, depth))
+    if quantized is None:
+        background = sgr[2] == "4"
+        r, g, b = (int(value) for value in sgr[7:-1].split(";"))
+        if depth == "256":
+            quantized = f"\033[{48 if background else 38};5;{rgb_to_256(r, g, b)}m"
+        else:
+            index = rgb_to_16(r, g, b)
+            base = 40 if background else 30
+            quantized = f"\033[{base + index if index < 8 else base + 52 + index}m"
+        _quantized[sgr, depth] = quantized
+    return quantized
+
+# Ask terminfo how many colors TERM supports
+def terminfo_depth(term):
+    try:
+        import curses
+    except ImportError:
+        return "16"
+    fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        curses.setupterm(term or "dumb", fd)
+        colors = curses.tigetnum("colors")
+        direct = curses.tigetflag("RGB") == 1
+    except curses.error:
+        return "16"
+    finally:
+        os.close(fd)
+    if direct or colors >= 1 << 24:
+        return "truecolor"
+    if colors >= 256:
+        return "256"
+    return "16"
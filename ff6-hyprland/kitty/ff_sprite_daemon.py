@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# Resident Final Fantasy Sprite Server for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+#
+# Keeps every rendered frame in memory and answers on a Unix domain socket,
+# so new kitty windows skip interpreter startup and rendering altogether.
+# A client sends one line holding the render mode, a character name and a
+# comma-separated list of games, separated by tabs (name and games may be
+# empty for a random sprite from any game), and gets back the finished frame
+# stamped with the current date.
+# Each connection is served on its own thread, so a burst of windows opened
+# by session restore is answered in parallel.
+#
+# Started from hyprland.conf; ff_sprite_client.sh and ff_sprite.py fall back
+# to rendering themselves when it is not running.
+
+import importlib
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+import ff_sprite
+
+class FrameStore:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Picks read and rewrite the shared recent-history file
+        self.pick_lock = threading.Lock()
+        self.stamp = None
+        self.frames = {}
+        self.refresh()
+        for mode in ff_sprite.RENDER_MODES:
+            self.mode_frames(mode)
+
+    # mtime and size of every source file, to notice edits without hashing
+    def source_stamp(self):
+        stamp = []
+        for name in ff_sprite.SOURCE_FILES:
+            st = os.stat(os.path.join(ff_sprite.SCRIPT_DIR, name))
+            stamp.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamp)
+
+    # Drop all rendered frames if the sprite sources changed since the last call
+    def refresh(self):
+        global ff_sprite
+        stamp = self.source_stamp()
+        if stamp == self.stamp:
+            return
+        with self.lock:
+            if stamp == self.stamp:
+                return
+            if self.stamp is not None:
+                for name in ff_sprite.SOURCE_FILES:
+                    module = sys.modules.get(name[:-3])
+                    if module is not None and module is not ff_sprite:
+                        importlib.reload(module)
+                ff_sprite = importlib.reload(ff_sprite)
+            self.frames = {}
+            self.key = ff_sprite.source_key()
+            self.stamp = stamp
+
+    # name -> (head, tail) for a render mode, rendered on first use. Kitty
+    # frames are rendered again if their images were removed from the cache.
+    def mode_frames(self, mode):
+        frames = self.frames.get(mode)
+        if mode == "kitty" and frames and not all(os.path.exists(ff_sprite.image_path(name)) for name in frames):
+            frames = None
+            with self.lock:
+                self.frames.pop(mode, None)
+        if frames is None:
+            with self.lock:
+                frames = self.frames.get(mode)
+                if frames is None:
+                    frames = {name.decode(): (head, tail) for name, head, tail in ff_sprite.render_frames(mode)}
+                    self.frames[mode] = frames
+        return frames
+
+    def frame(self, character_name=None, mode="truecolor", games=()):
+        self.refresh()
+        frames = self.mode_frames(mode)
+        with self.pick_lock:
+            sprite = ff_sprite.choose_sprite(self.key, character_name, games)
+        if isinstance(sprite, tuple):
+            # Atlas sprites are read and rendered per request
+            head, tail = ff_sprite.render_atlas_frame(sprite, mode)
+        else:
+            head, tail = frames.get(sprite) or frames[tuple(frames)[int.from_bytes(os.urandom(4), "little") % len(frames)]]
+        return head + time.strftime(ff_sprite.DATE_FORMAT).encode() + tail
+
+class FrameHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = self.rfile.readline(256)
+        if not request:
+            # Connection probe or client that gave up
+            return
+        mode, _, request = request.decode("utf-8", "replace").strip("\r\n").partition("\t")
+        character_name, _, games = request.partition("\t")
+        if mode not in ff_sprite.RENDER_MODES:
+            mode = "truecolor"
+        games = tuple(game.strip().lower() for game in games.split(",") if game.strip())
+        try:
+            self.wfile.write(self.server.store.frame(character_name.strip() or None, mode, games))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+class FrameServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    # Session restore can open dozens of windows at once
+    request_queue_size = 128
+
+    def __init__(self, path, store):
+        self.store = store
+        super().__init__(path, FrameHandler)
+
+# True if another daemon is already answering on path
+def daemon_running(path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            return False
+    return True
+
+def main():
+    path = ff_sprite.SOCKET_FILE
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    if os.path.exists(path):
+        if daemon_running(path):
+            print(f"Sprite daemon already running on {path}", file=sys.stderr)
+            return 0
+        os.unlink(path)
+
+    store = FrameStore()
+    old_umask = os.umask(0o077)
+    try:
+        server = FrameServer(path, store)
+    finally:
+        os.umask(old_umask)
+
+    # serve_forever() has to be stopped from another thread
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+# Final Fantasy Sprite Data for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+# Created: April 2025
+#
+# Only imported when frames have to be (re)rendered; the launcher in
+# ff_sprite.py normally serves pre-rendered frames from the on-disk cache.
+
+from collections.abc import Mapping
+
+# ANSI color codes for more vibrant, authentic FF character colors
+class Colors:
+    RESET = "\033[0m"
+    BLACK = "\033[30m"
+    RED = "\033[31m"
+    GREEN = "\033[32m"
+    YELLOW = "\033[33m"
+    BLUE = "\033[34m"
+    MAGENTA = "\033[35m"
+    CYAN = "\033[36m"
+    WHITE = "\033[37m"
+    BRIGHT_BLACK = "\033[90m"
+    BRIGHT_RED = "\033[91m"
+    BRIGHT_GREEN = "\033[92m"
+    BRIGHT_YELLOW = "\033[93m"
+    BRIGHT_BLUE = "\033[94m"
+    BRIGHT_MAGENTA = "\033[95m"
+    BRIGHT_CYAN = "\033[96m"
+    BRIGHT_WHITE = "\033[97m"
+    BOLD = "\033[1m"
+    
+    # Custom colors for authentic FF character sprites
+    TERRA_GREEN = "\033[38;2;0;180;0m"
+    TERRA_HAIR = "\033[38;2;0;255;128m"
+    LOCKE_BLUE = "\033[38;2;100;140;220m"
+    LOCKE_SKIN = "\033[38;2;255;200;160m"
+    EDGAR_BLUE = "\033[38;2;50;100;255m"
+    EDGAR_HAIR = "\033[38;2;255;240;150m"
+    SABIN_ORANGE = "\033[38;2;255;160;0m"
+    SABIN_SKIN = "\033[38;2;255;190;140m"
+    CYAN_BLUE = "\033[38;2;0;100;200m"
+    CYAN_ARMOR = "\033[38;2;0;150;255m"
+    SHADOW_PURPLE = "\033[38;2;100;0;100m"
+    SHADOW_GRAY = "\033[38;2;100;100;100m"
+    CELES_YELLOW = "\033[38;2;255;255;150m"
+    CELES_ARMOR = "\033[38;2;200;200;255m"
+    SETZER_COAT = "\033[38;2;180;180;180m"
+    SETZER_HAIR = "\033[38;2;220;220;220m"
+    RELM_RED = "\033[38;2;255;100;100m"
+    RELM_YELLOW = "\033[38;2;255;255;100m"
+    STRAGO_BLUE = "\033[38;2;100;100;255m"
+    STRAGO_ROBE = "\033[38;2;80;80;200m"
+    MOG_PINK = "\033[38;2;255;180;220m"
+    MOG_FUR = "\033[38;2;255;220;240m"
+    UMARO_BLUE = "\033[38;2;150;200;255m"
+    UMARO_FUR = "\033[38;2;220;240;255m"
+    GOGO_YELLOW = "\033[38;2;255;220;0m"
+    GOGO_ROBE = "\033[38;2;255;180;0m"
+    KEFKA_RED = "\033[38;2;255;50;50m"
+    KEFKA_YELLOW = "\033[38;2;255;255;50m"
+    KEFKA_GREEN = "\033[38;2;50;255;50m"
+    KEFKA_BLUE = "\033[38;2;50;50;255m"
+    KEFKA_PURPLE = "\033[38;2;200;50;200m"
+    ULTROS_PURPLE = "\033[38;2;180;50;180m"
+    ULTROS_PINK = "\033[38;2;255;150;220m"
+    GILGAMESH_RED = "\033[38;2;220;50;50m"
+    GILGAMESH_GRAY = "\033[38;2;150;150;150m"
+    EXDEATH_BLUE = "\033[38;2;50;50;150m"
+    EXDEATH_PURPLE = "\033[38;2;100;0;100m"
+    GOLBEZ_PURPLE = "\033[38;2;120;0;120m"
+    GOLBEZ_ARMOR = "\033[38;2;80;0;80m"
+    GARLAND_BLUE = "\033[38;2;0;0;150m"
+    GARLAND_ARMOR = "\033[38;2;50;50;100m"
+    CHAOS_RED = "\033[38;2;200;0;0m"
+    CHAOS_ORANGE = "\033[38;2;255;100;0m"
+
+# Sprites are stored as palette-indexed grids: a template pairs the glyph rows
+# with one palette slot per cell, and each character only supplies the colors
+# for those slots. Adding a character is a single palette row.
+
+# Palette slots used by the templates
+OUTLINE, HAIR, BAND, EYES, FACE, TRIM, BODY, ACCENT1, ACCENT2, ACCENT3 = range(10)
+
+_DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+# Turn rows of slot digits into compact bytes rows
+def _slots(*rows):
+    return tuple(row.translate(_DIGITS) for row in rows)
+
+HERO_GLYPHS = (
+    "      ▄▄▄▄▄      ",
+    "     ▄▀▀▀▀▀▄     ",
+    "    █▄▄███▄▄█    ",
+    "    ██▀███▀██    ",
+    "    █▀▀▀▀▀▀▀█    ",
+    "    █▄▀▀▀▀▀▄█    ",
+    "    █████████    ",
+    "     ▀█▀▀▀█▀     ",
+    "      ██ ██      ",
+)
+
+# Second idle frame: eyes closed and feet apart
+IDLE_GLYPHS = HERO_GLYPHS[:8] + ("     █▀   ▀█     ",)
+
+SPRITE_TEMPLATES = {
+    "hero": (HERO_GLYPHS, _slots(
+        b"00000000000000000",
+        b"00000011111000000",
+        b"00000221112200000",
+        b"00000131113100000",
+        b"00000444444400000",
+        b"00000544444500000",
+        b"00000666666600000",
+        b"00000060006000000",
+        b"00000006060000000",
+    )),
+    # Kefka's patchwork jester outfit
+    "jester": (HERO_GLYPHS, _slots(
+        b"00000000000000000",
+        b"00000011111000000",
+        b"00000221112200000",
+        b"00000131113100000",
+        b"00000444444400000",
+        b"00000578967500000",
+        b"00000667896700000",
+        b"00000060006000000",
+        b"00000006060000000",
+    )),
+    "hero_idle": (IDLE_GLYPHS, _slots(
+        b"00000000000000000",
+        b"00000011111000000",
+        b"00000221112200000",
+        b"00000111111100000",
+        b"00000444444400000",
+        b"00000544444500000",
+        b"00000666666600000",
+        b"00000060006000000",
+        b"00000060006000000",
+    )),
+    "jester_idle": (IDLE_GLYPHS, _slots(
+        b"00000000000000000",
+        b"00000011111000000",
+        b"00000221112200000",
+        b"00000111111100000",
+        b"00000444444400000",
+        b"00000578967500000",
+        b"00000667896700000",
+        b"00000060006000000",
+        b"00000060006000000",
+    )),
+}
+
+# Frames of the idle animation for each base template
+SPRITE_ANIMATIONS = {
+    "hero": ("hero", "hero_idle"),
+    "jester": ("jester", "jester_idle"),
+}
+
+# name: (template, outline, hair, band, eyes, face, trim, body[, accents])
+SPRITE_PALETTES = {
+    # FF6 Characters
+    "Terra": ("hero", Colors.BLACK, Colors.TERRA_HAIR, Colors.TERRA_HAIR, Colors.BLACK, Colors.LOCKE_SKIN, Colors.TERRA_GREEN, Colors.TERRA_GREEN),
+    "Locke": ("hero", Colors.BLACK, Colors.LOCKE_SKIN, Colors.BRIGHT_YELLOW, Colors.BLACK, Colors.LOCKE_SKIN, Colors.LOCKE_BLUE, Colors.LOCKE_BLUE),
+    "Edgar": ("hero", Colors.BLACK, Colors.EDGAR_HAIR, Colors.EDGAR_HAIR, Colors.BLACK, Colors.LOCKE_SKIN, Colors.EDGAR_BLUE, Colors.EDGAR_BLUE),
+    "Sabin": ("hero", Colors.BLACK, Colors.EDGAR_HAIR, Colors.EDGAR_HAIR, Colors.BLACK, Colors.SABIN_SKIN, Colors.SABIN_ORANGE, Colors.SABIN_ORANGE),
+    "Cyan": ("hero", Colors.BLACK, Colors.BLACK, Colors.BLACK, Colors.BLACK, Colors.LOCKE_SKIN, Colors.CYAN_ARMOR, Colors.CYAN_BLUE),
+    "Shadow": ("hero", Colors.BLACK, Colors.SHADOW_GRAY, Colors.SHADOW_GRAY, Colors.RED, Colors.LOCKE_SKIN, Colors.SHADOW_PURPLE, Colors.SHADOW_PURPLE),
+    "Celes": ("hero", Colors.BLACK, Colors.CELES_YELLOW, Colors.CELES_YELLOW, Colors.BLACK, Colors.LOCKE_SKIN, Colors.CELES_ARMOR, Colors.CELES_ARMOR),
+    "Setzer": ("hero", Colors.BLACK, Colors.SETZER_HAIR, Colors.SETZER_HAIR, Colors.BLACK, Colors.LOCKE_SKIN, Colors.SETZER_COAT, Colors.SETZER_COAT),
+    "Mog": ("hero", Colors.BLACK, Colors.MOG_FUR, Colors.MOG_FUR, Colors.RED, Colors.MOG_FUR, Colors.MOG_PINK, Colors.MOG_PINK),
+    "Kefka": ("jester", Colors.BLACK, Colors.KEFKA_YELLOW, Colors.KEFKA_YELLOW, Colors.BLACK, Colors.WHITE, Colors.KEFKA_RED, Colors.KEFKA_RED, Colors.KEFKA_GREEN, Colors.KEFKA_BLUE, Colors.KEFKA_PURPLE),
+    "Ultros": ("hero", Colors.BLACK, Colors.ULTROS_PURPLE, Colors.ULTROS_PURPLE, Colors.WHITE, Colors.ULTROS_PURPLE, Colors.ULTROS_PINK, Colors.ULTROS_PINK),
+    
+    # FF5 Characters
+    "Bartz": ("hero", Colors.BLACK, Colors.BRIGHT_YELLOW, Colors.BRIGHT_YELLOW, Colors.BLACK, Colors.LOCKE_SKIN, Colors.BRIGHT_BLUE, Colors.BRIGHT_BLUE),
+    "Gilgamesh": ("hero", Colors.BLACK, Colors.GILGAMESH_GRAY, Colors.GILGAMESH_GRAY, Colors.BLACK, Colors.GILGAMESH_GRAY, Colors.GILGAMESH_RED, Colors.GILGAMESH_RED),
+    "Exdeath": ("hero", Colors.BLACK, Colors.EXDEATH_BLUE, Colors.EXDEATH_BLUE, Colors.RED, Colors.EXDEATH_BLUE, Colors.EXDEATH_PURPLE, Colors.EXDEATH_PURPLE),
+    
+    # FF4 Characters
+    "Cecil": ("hero", Colors.BLACK, Colors.WHITE, Colors.WHITE, Colors.BLACK, Colors.LOCKE_SKIN, Colors.BRIGHT_CYAN, Colors.BRIGHT_CYAN),
+    "Golbez": ("hero", Colors.BLACK, Colors.GOLBEZ_ARMOR, Colors.GOLBEZ_ARMOR, Colors.RED, Colors.GOLBEZ_ARMOR, Colors.GOLBEZ_PURPLE, Colors.GOLBEZ_PURPLE),
+    
+    # FF1 Characters
+    "Warrior of Light": ("hero", Colors.BLACK, Colors.BRIGHT_BLUE, Colors.BRIGHT_BLUE, Colors.BLACK, Colors.LOCKE_SKIN, Colors.BRIGHT_CYAN, Colors.BRIGHT_CYAN),
+    "Garland": ("hero", Colors.BLACK, Colors.GARLAND_ARMOR, Colors.GARLAND_ARMOR, Colors.RED, Colors.GARLAND_ARMOR, Colors.GARLAND_BLUE, Colors.GARLAND_BLUE),
+    "Chaos": ("hero", Colors.BLACK, Colors.CHAOS_RED, Colors.CHAOS_RED, Colors.YELLOW, Colors.CHAOS_RED, Colors.CHAOS_ORANGE, Colors.CHAOS_ORANGE),
+}
+
+# Built-in sprite packs, one per game
+SPRITE_PACKS = {
+    "ff6": ("Terra", "Locke", "Edgar", "Sabin", "Cyan", "Shadow", "Celes", "Setzer", "Mog", "Kefka", "Ultros"),
+    "ff5": ("Bartz", "Gilgamesh", "Exdeath"),
+    "ff4": ("Cecil", "Golbez"),
+    "ff1": ("Warrior of Light", "Garland", "Chaos"),
+}
+
+# Generate the ANSI rows of a sprite from its template and palette, with the
+# palette quantized to the terminal's color depth
+def render_sprite(palette, depth="truecolor", template=None):
+    from ff_sprite_color import quantize_sgr
+
+    glyph_rows, slot_rows = SPRITE_TEMPLATES[template or palette[0]]
+    colors = [quantize_sgr(sgr, depth) for sgr in palette[1:]]
+    rows = []
+    for glyphs, slots in zip(glyph_rows, slot_rows):
+        parts = []
+        current = None
+        for glyph, slot in zip(glyphs, slots):
+            if slot != current:
+                parts.append(colors[slot])
+                current = slot
+            parts.append(glyph)
+        parts.append(Colors.RESET)
+        rows.append("".join(parts))
+    return rows
+
+# Read-only name -> ANSI rows mapping, rendering each sprite on first use
+class SpriteTable(Mapping):
+    def __init__(self, palettes, depth="truecolor"):
+        self.palettes = palettes
+        self.depth = depth
+        self.rows = {}
+
+    def __getitem__(self, character_name):
+        rows = self.rows.get(character_name)
+        if rows is None:
+            rows = self.rows[character_name] = render_sprite(self.palettes[character_name], self.depth)
+        return rows
+
+    def __iter__(self):
+        return iter(self.palettes)
+
+    def __len__(self):
+        return len(self.palettes)
+
+ff_sprites = SpriteTable(SPRITE_PALETTES)
+
+_sprite_tables = {"truecolor": ff_sprites}
+
+# The sprite table for a color depth ("truecolor", "256" or "16")
+def sprite_table(depth):
+    table = _sprite_tables.get(depth)
+    if table is None:
+        table = _sprite_tables[depth] = SpriteTable(SPRITE_PALETTES, depth)
+    return table
+
+# ANSI rows for every frame of a character's idle animation
+def sprite_animation(character_name, depth="truecolor"):
+    palette = SPRITE_PALETTES[character_name]
+    return [render_sprite(palette, depth, template) for template in SPRITE_ANIMATIONS[palette[0]]]
@@ -0,0 +1,97 @@
+# Final Fantasy Sprite Images for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+#
+# Kitty graphics protocol backend: each sprite grid is rasterized once to a
+# PNG in the cache directory and handed to kitty by file path (t=f), so no
+# pixel data travels through the tty. Every sprite has a stable image ID.
+# Kitty keeps images per window, so each new window sends the (short) path
+# once. PNGs are replaced atomically, as other windows may be reading them.
+
+import os
+import struct
+import zlib
+
+# Device pixels per half cell; kitty scales the image to the cell area
+SCALE = 8
+
+# The 16 base colors as set in kitty.conf
+ANSI_RGB = {
+    30: (0x00, 0x00, 0x00), 31: (0x40, 0x80, 0xFF), 32: (0x00, 0xAA, 0x00), 33: (0xFF, 0xAA, 0x00),
+    34: (0x20, 0x50, 0xC0), 35: (0xAA, 0x00, 0xAA), 36: (0x00, 0xAA, 0xAA), 37: (0xAA, 0xAA, 0xAA),
+    90: (0x55, 0x55, 0x55), 91: (0x60, 0x90, 0xFF), 92: (0x00, 0xDD, 0x00), 93: (0xFF, 0xDD, 0x00),
+    94: (0x40, 0x80, 0xFF), 95: (0xFF, 0x00, 0xFF), 96: (0x00, 0xFF, 0xFF), 97: (0xFF, 0xFF, 0xFF),
+}
+
+TRANSPARENT = b"\0\0\0\0"
+
+# Which halves of a cell each glyph fills: (upper, lower)
+GLYPH_HALVES = {"█": (True, True), "▀": (True, False), "▄": (False, True), " ": (False, False)}
+
+# RGBA bytes for a foreground SGR sequence such as "\033[38;2;r;g;bm"
+def sgr_rgba(sgr):
+    params = sgr[2:-1].split(";")
+    if params[:2] == ["38", "2"]:
+        rgb = tuple(int(value) for value in params[2:5])
+    else:
+        rgb = ANSI_RGB[int(params[0])]
+    return bytes(rgb) + b"\xff"
+
+# Stable, non-zero image ID for a character or other image name
+def image_id(image_name):
+    return zlib.crc32(image_name.encode()) & 0xFFFFFF or 1
+
+# Rasterize a sprite to (width, height, RGBA bytes)
+def rasterize(palette, scale=SCALE):
+    from ff_sprite_data import SPRITE_TEMPLATES
+
+    glyph_rows, slot_rows = SPRITE_TEMPLATES[palette[0]]
+    colors = [sgr_rgba(sgr) for sgr in palette[1:]]
+    pixels = bytearray()
+    for glyphs, slots in zip(glyph_rows, slot_rows):
+        upper_row = bytearray()
+        lower_row = bytearray()
+        for glyph, slot in zip(glyphs, slots):
+            upper, lower = GLYPH_HALVES[glyph]
+            upper_row += (colors[slot] if upper else TRANSPARENT) * scale
+            lower_row += (colors[slot] if lower else TRANSPARENT) * scale
+        pixels += bytes(upper_row) * scale + bytes(lower_row) * scale
+    return len(glyph_rows[0]) * scale, len(glyph_rows) * 2 * scale, bytes(pixels)
+
+def png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+# Encode RGBA pixels as a PNG, which kitty reads straight from the file
+def encode_png(width, height, pixels):
+    stride = width * 4
+    scanlines = b"".join(b"\0" + pixels[y * stride:(y + 1) * stride] for y in range(height))
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)),
+        png_chunk(b"IDAT", zlib.compress(scanlines, 9)),
+        png_chunk(b"IEND", b""),
+    ))
+
+# Write the PNG for a character to path. image is (width, height, RGBA
+# pixels) for sprites that are not in the built-in table; those are named
+# after their contents, so an existing file is left alone.
+def write_sprite_image(character_name, path, image=None):
+    if image is not None and os.path.exists(path):
+        return
+    import threading
+
+    if image is None:
+        from ff_sprite_data import SPRITE_PALETTES
+        image = rasterize(SPRITE_PALETTES[character_name])
+    # The daemon may write the same atlas image from two threads
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encode_png(*image))
+    os.replace(tmp_path, path)
+
+# Upload the PNG at path as the image named image_name and place it over a
+# columns x rows cell area at the cursor, leaving the cursor where it is
+def transmit_command(image_name, path, columns, rows):
+    import base64
+
+    payload = base64.standard_b64encode(path.encode()).decode()
+    return f"\033_Ga=T,f=100,t=f,i={image_id(image_name)},c={columns},r={rows},C=1,q=2;{payload}\033\\"
@@ -0,0 +1,233 @@
+# Final Fantasy Sprite Packs for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+#
+# Sprites come in packs: one built-in pack per game (ff6, ff5, ff4, ff1) and
+# one per atlas imported with ff_sprite_atlas.py. The packs are summarized in
+# a small marshal index holding, for every game, an alias table over its
+# packs, so a launch reads one file and picks a sprite in constant time no
+# matter how many packs or sprites are installed. Sprite names are kept in a
+# separate file that is only read when a sprite is asked for by name. Pack
+# contents are only read when the index is rebuilt, which happens when the
+# sprite directory, packs.conf or the sprite sources change.
+#
+# packs.conf in the sprite directory adjusts packs, one per line:
+#     <pack> <weight> [game]
+# The weight applies to each sprite of the pack (default 1, 0 disables it).
+# The game defaults to the pack name in lower case and is what FF_SPRITE_GAMES
+# filters on.
+#
+# The last few picks are remembered so new windows do not repeat them.
+
+import marshal
+import os
+
+INDEX_VERSION = 2
+PACKS_CONF = "packs.conf"
+
+# Picks remembered across launches, and redraws allowed to avoid them
+HISTORY_SIZE = 4
+HISTORY_RETRIES = 8
+
+# Alias table over integer weights (Vose's method). Column i is kept when a
+# 32-bit random number is below thresholds[i], otherwise aliases[i] is used.
+def alias_table(weights):
+    count = len(weights)
+    total = sum(weights)
+    scaled = [weight * count for weight in weights]
+    thresholds = [1 << 32] * count
+    aliases = list(range(count))
+    small = [i for i in range(count) if scaled[i] < total]
+    large = [i for i in range(count) if scaled[i] >= total]
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        thresholds[less] = (scaled[less] << 32) // total
+        aliases[less] = more
+        scaled[more] -= total - scaled[less]
+        (small if scaled[more] < total else large).append(more)
+    return tuple(thresholds), tuple(aliases)
+
+def read_settings(path):
+    settings = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                fields = line.split("#", 1)[0].split()
+                if not fields:
+                    continue
+                try:
+                    weight = max(int(fields[1]), 0) if len(fields) > 1 else 1
+                except ValueError:
+                    continue
+                settings[fields[0]] = (weight, fields[2].lower() if len(fields) > 2 else None)
+    except OSError:
+        pass
+    return settings
+
+class SpritePacks:
+    def __init__(self, atlas_dir, index_file, names_file, history_file):
+        self.atlas_dir = atlas_dir
+        self.index_file = index_file
+        self.names_file = names_file
+        self.history_file = history_file
+
+    # Changes whenever a pack is added, removed, replaced or reconfigured
+    def index_key(self, source_key):
+        stamps = []
+        for path in (self.atlas_dir, os.path.join(self.atlas_dir, PACKS_CONF)):
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(0)
+        return (INDEX_VERSION, source_key, *stamps)
+
+    # Contents of a marshal file written for key, or None
+    def load(self, path, key):
+        try:
+            with open(path, "rb") as f:
+                data = marshal.load(f)
+            if data[0] == key:
+                return data
+        except (OSError, EOFError, ValueError, TypeError, IndexError):
+            pass
+        return None
+
+    def save(self, path, data):
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_file = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_file, "wb") as f:
+                marshal.dump(data, f)
+            os.replace(tmp_file, path)
+        except OSError:
+            pass
+
+    # Rebuild and store the index and the sprite names for key
+    def rebuild(self, key):
+        index, names = self.build_index(key)
+        self.save(self.names_file, names)
+        self.save(self.index_file, index)
+        return index, names
+
+    # Index for source_key, read from index_file or rebuilt
+    def index(self, source_key):
+        key = self.index_key(source_key)
+        return self.load(self.index_file, key) or self.rebuild(key)[0]
+
+    # (key, packs, tables) and (key, names). A pack is (name, game, members,
+    # sprite count, weight) where members is a tuple of built-in names or an
+    # atlas path. tables maps each game, and "" for all of them, to (pack
+    # numbers, thresholds, aliases, total weight, sprite count); names maps
+    # sprite names to (pack number, sprite number).
+    def build_index(self, key):
+        from ff_sprite_data import SPRITE_PACKS
+
+        settings = read_settings(os.path.join(self.atlas_dir, PACKS_CONF))
+        # (pack name, members, sprite names)
+        sources = [(pack_name, members, members) for pack_name, members in SPRITE_PACKS.items()]
+        try:
+            files = sorted(os.listdir(self.atlas_dir))
+        except OSError:
+            files = []
+        atlases = [os.path.join(self.atlas_dir, name) for name in files if name.endswith(".atlas")]
+        if atlases:
+            from ff_sprite_atlas import atlas_names
+            for path in atlases:
+                try:
+                    sprite_names = atlas_names(path)
+                except (OSError, ValueError):
+                    continue
+                if sprite_names:
+                    sources.append((os.path.basename(path)[:-len(".atlas")], path, sprite_names))
+
+        packs = []
+        names = {}
+        games = {}
+        for pack_name, members, sprite_names in sources:
+            weight, game = settings.get(pack_name, (1, None))
+            game = game or pack_name.lower()
+            for number, sprite_name in enumerate(sprite_names):
+                names.setdefault(sprite_name, (len(packs), number))
+            if weight:
+                games.setdefault(game, []).append(len(packs))
+            packs.append((pack_name, game, members, len(sprite_names), weight))
+
+        tables = {}
+        games[""] = [number for numbers in games.values() for number in numbers]
+        for game, numbers in games.items():
+            if not numbers:
+                continue
+            weights = [packs[number][3] * packs[number][4] for number in numbers]
+            thresholds, aliases = alias_table(weights)
+            tables[game] = (tuple(numbers), thresholds, aliases, sum(weights), sum(packs[number][3] for number in numbers))
+        return (key, tuple(packs), tables), (key, names)
+
+    # A built-in sprite name, or an (atlas path, sprite number) pair
+    def sprite(self, index, pack_number, number):
+        members = index[1][pack_number][2]
+        if isinstance(members, str):
+            return members, number
+        return members[number]
+
+    # The sprite called name, or None
+    def find(self, source_key, name):
+        key = self.index_key(source_key)
+        index = self.load(self.index_file, key)
+        names = self.load(self.names_file, key)
+        if index is None or names is None:
+            index, names = self.rebuild(key)
+        found = names[1].get(name)
+        return found and self.sprite(index, *found)
+
+    def draw(self, tables):
+        random = int.from_bytes(os.urandom(16), "little")
+        table = tables[0]
+        if len(tables) > 1:
+            choice = (random >> 96) % sum(table[3] for table in tables)
+            for table in tables:
+                if choice < table[3]:
+                    break
+                choice -= table[3]
+        numbers, thresholds, aliases, _, _ = table
+        column = (random & 0xFFFFFFFF) % len(numbers)
+        if (random >> 32) & 0xFFFFFFFF >= thresholds[column]:
+            column = aliases[column]
+        return numbers[column], random >> 64 & 0xFFFFFFFF
+
+    # Pick a sprite from the given games (all of them if none), avoiding
+    # recent picks. Returns None if every pack is disabled.
+    def pick(self, source_key, games=()):
+        index = self.index(source_key)
+        tables = [index[2][game] for game in dict.fromkeys(games) if game in index[2]] or [index[2].get("")]
+        if tables[0] is None:
+            return None
+        recent = self.history()
+        window = min(HISTORY_SIZE, sum(table[4] for table in tables) - 1)
+        avoid = recent[-window:] if window > 0 else []
+        for _ in range(HISTORY_RETRIES):
+            pack_number, random = self.draw(tables)
+            pack = index[1][pack_number]
+            number = random % pack[3]
+            pick = f"{pack[0]}/{number}"
+            if pick not in avoid:
+                break
+        self.remember(recent, pick)
+        return self.sprite(index, pack_number, number)
+
+    def history(self):
+        try:
+            with open(self.history_file) as f:
+                return f.read().splitlines()
+        except OSError:
+            return []
+
+    def remember(self, recent, pick):
+        recent = [item for item in recent if item != pick][-(HISTORY_SIZE - 1):] + [pick]
+        try:
+            os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
+            tmp_file = f"{self.history_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "w") as f:
+                f.write("\n".join(recent) + "\n")
+            os.replace(tmp_file, self.history_file)
+        except OSError:
+            pass
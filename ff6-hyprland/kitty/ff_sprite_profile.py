@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# Final Fantasy Sprite Launch Profiler for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+#
+# With FF_SPRITE_PROFILE=1 in the environment, ff_sprite.py times each phase
+# of its launch and appends one JSON line to PROFILE_FILE (or to the path
+# FF_SPRITE_PROFILE names). Phases:
+#   startup  process start to main (clock tick resolution, usually 10 ms)
+#   detect   render mode detection
+#   daemon   asking the sprite daemon for a frame
+#   table    opening or building the frame cache / sprite table
+#   select   picking the sprite and its frame
+#   render   rendering and assembling the output
+#   write    writing to the tty
+#   imports  time spent importing modules, overlapping the phases above
+#   total    process start to the end of the write
+#
+# Run this script to print percentiles over the recorded launches:
+#   ff_sprite_profile.py [--last N] [FILE]
+
+import builtins
+import os
+import sys
+import time
+
+PHASES = ("startup", "detect", "daemon", "table", "select", "render", "write", "imports", "total")
+PERCENTILES = (50, 90, 99)
+
+# Nanoseconds since this process was started, from /proc/self/stat
+def process_age_ns():
+    with open("/proc/self/stat") as f:
+        # Skip past the command name, which may contain spaces
+        fields = f.read().rpartition(")")[2].split()
+    started = int(fields[19]) * 1_000_000_000 // os.sysconf("SC_CLK_TCK")
+    return time.clock_gettime_ns(time.CLOCK_BOOTTIME) - started
+
+class LaunchProfile:
+    def __init__(self):
+        self.started = time.perf_counter_ns() - process_age_ns()
+        self.last = time.perf_counter_ns()
+        self.phases = {"startup": self.last - self.started}
+        self.fields = {}
+        self.import_ns = 0
+        self.import_depth = 0
+        self.original_import = builtins.__import__
+        builtins.__import__ = self.timed_import
+
+    # Count the time spent loading modules, outermost imports only
+    def timed_import(self, name, *args, **kwargs):
+        if self.import_depth or name in sys.modules:
+            return self.original_import(name, *args, **kwargs)
+        self.import_depth += 1
+        start = time.perf_counter_ns()
+        try:
+            return self.original_import(name, *args, **kwargs)
+        finally:
+            self.import_ns += time.perf_counter_ns() - start
+            self.import_depth -= 1
+
+    # Charge the time since the previous mark to phase
+    def mark(self, phase, **fields):
+        now = time.perf_counter_ns()
+        self.phases[phase] = self.phases.get(phase, 0) + now - self.last
+        self.last = now
+        self.fields.update(fields)
+
+    def record(self, **fields):
+        self.phases["imports"] = self.import_ns
+        self.phases["total"] = self.last - self.started
+        builtins.__import__ = self.original_import
+        record = {"time": round(time.time(), 3), **fields, **self.fields}
+        record["ms"] = {phase: round(ns / 1e6, 3) for phase, ns in self.phases.items()}
+        return record
+
+    # Append the record with a single O_APPEND write, so concurrent launches
+    # do not interleave
+    def save(self, path, **fields):
+        # record() stops the import timing, so json is not counted
+        record = self.record(**fields)
+        import json
+
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode())
+        finally:
+            os.close(fd)
+
+def read_records(path, last=None):
+    import json
+
+    records = []
+    with open(path) as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records[-last:] if last else records
+
+# Nearest-rank percentile of sorted values
+def percentile(values, p):
+    return values[max(0, -(-len(values) * p // 100) - 1)]
+
+# Percentile table of every phase, one section per launch path
+def summarize(records):
+    lines = []
+    for path in sorted({record.get("path", "?") for record in records}):
+        group = [record for record in records if record.get("path", "?") == path]
+        lines.append(f"{path}: {len(group)} launches")
+        lines.append(f"  {'phase':<8}" + "".join(f"{'p' + str(p):>9}" for p in PERCENTILES) + f"{'max':>9}")
+        for phase in PHASES:
+            values = sorted(record["ms"][phase] for record in group if phase in record.get("ms", {}))
+            if values:
+                lines.append(f"  {phase:<8}" + "".join(f"{percentile(values, p):>9.2f}" for p in PERCENTILES) + f"{values[-1]:>9.2f}")
+        sizes = sorted(record["bytes"] for record in group if "bytes" in record)
+        if sizes:
+            lines.append(f"  {'bytes':<8}" + "".join(f"{percentile(sizes, p):>9}" for p in PERCENTILES) + f"{sizes[-1]:>9}")
+    return "\n".join(lines)
+
+def main():
+    import argparse
+
+    import ff_sprite
+
+    parser = argparse.ArgumentParser(description="Summarize ff_sprite.py launch timings.")
+    parser.add_argument("file", nargs="?", default=ff_sprite.PROFILE_FILE)
+    parser.add_argument("--last", type=int, help="only the last N launches")
+    args = parser.parse_args()
+
+    try:
+        records = read_records(args.file, args.last)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if not records:
+        print(f"No launches recorded in {args.file}; open terminals with FF_SPRITE_PROFILE=1 set", file=sys.stderr)
+        return 1
+    print(summarize(records))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+# Final Fantasy Sprite Rendering Helpers for Kitty Terminal
+# Theme: Final Fantasy VI Menu Style with authentic character sprites
+#
+# The sprite rows and box borders are written with a full SGR sequence in
+# front of almost every glyph. minimize_sgr() re-encodes a rendered frame so
+# that only real style transitions are sent: it tracks the foreground,
+# background and bold state plus any other attributes (underline, reverse,
+# ...), lets plain spaces inherit whatever style is active, merges adjacent
+# runs of the same style and leaves one reset at the end. Attributes without
+# a known off code are passed through and only ended with a reset.
+#
+# visible_width() measures text as the terminal lays it out, so the menu box
+# can be centered on cells rather than on string length.
+#
+# Run directly to print before/after byte counts for every sprite.
+
+import re
+import unicodedata
+
+SGR_PATTERN = re.compile(r"\033\[([0-9;]*)m")
+
+# (fg, bg, bold, other attributes in the order they were set)
+DEFAULT_STYLE = (None, None, False, ())
+
+# Attribute codes and the codes that turn them off; 22 also ends bold
+ATTRIBUTE_OFF = {"2": "22", "3": "23", "4": "24", "5": "25", "7": "27", "8": "28", "9": "29"}
+
+# Sprite row -> visible width, filled as rows are laid out
+_row_widths = {}
+
+# Number of terminal cells text occupies, ignoring SGR sequences. Box-drawing
+# and half-block glyphs take one cell, wide East Asian characters two.
+def visible_width(text):
+    width = 0
+    for char in SGR_PATTERN.sub("", text):
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in "WF" else 1
+    return width
+
+# visible_width() for sprite rows, which are laid out again for every frame
+def row_width(row):
+    width = _row_widths.get(row)
+    if width is None:
+        width = _row_widths[row] = visible_width(row)
+    return width
+
+# Attributes with code set last. Known attributes are kept in a fixed order
+# so equal states compare equal; the others keep the order they were set in.
+def add_attribute(attributes, code):
+    attributes = [a for a in attributes if a != code] + [code]
+    return tuple(sorted(attributes, key=lambda a: (a not in ATTRIBUTE_OFF, a if a in ATTRIBUTE_OFF else "")))
+
+# Apply the parameters of one SGR sequence to a style (see DEFAULT_STYLE)
+def apply_sgr(style, params):
+    fg, bg, bold, attributes = style
+    codes = params.split(";") if params else ["0"]
+    i = 0
+    while i < len(codes):
+        code = codes[i] or "0"
+        if code in ("38", "48", "58"):
+            # Extended color: 38;5;n or 38;2;r;g;b (58 colors underlines)
+            length = 3 if codes[i + 1:i + 2] == ["5"] else 5
+            color = ";".join(codes[i:i + length])
+            if code == "38":
+                fg = color
+            elif code == "48":
+                bg = color
+            else:
+                attributes = add_attribute(attributes, color)
+            i += length
+            continue
+        value = int(code) if code.isdigit() else -1
+        if value == 0:
+            fg, bg, bold, attributes = DEFAULT_STYLE
+        elif value == 1:
+            bold = True
+        elif 30 <= value <= 37 or 90 <= value <= 97:
+            fg = code
+        elif value == 39:
+            fg = None
+        elif 40 <= value <= 47 or 100 <= value <= 107:
+            bg = code
+        elif value == 49:
+            bg = None
+        elif code in ATTRIBUTE_OFF.values():
+            if value == 22:
+                bold = False
+            attributes = tuple(a for a in attributes if ATTRIBUTE_OFF.get(a) != code)
+        else:
+            attributes = add_attribute(attributes, code)
+        i += 1
+    return (fg, bg, bold, attributes)
+
+# Shortest SGR sequence that changes the terminal from style old to new
+def transition(old, new):
+    if new == DEFAULT_STYLE:
+        return "\033[0m"
+    params = []
+    old_other = [code for code in old[3] if code not in ATTRIBUTE_OFF]
+    new_other = [code for code in new[3] if code not in ATTRIBUTE_OFF]
+    if new_other[:len(old_other)] != old_other:
+        # Only a reset ends attributes without an off code
+        params.append("0")
+        old = DEFAULT_STYLE
+    off = [ATTRIBUTE_OFF[code] for code in old[3] if code not in new[3]]
+    if old[2] and not new[2]:
+        off.append("22")
+    off = list(dict.fromkeys(off))
+    params += off
+    if new[2] and not (old[2] and "22" not in off):
+        params.append("1")
+    params += [code for code in new[3] if code not in old[3] or ATTRIBUTE_OFF.get(code) in off]
+    if new[0] != old[0]:
+        params.append(new[0] or "39")
+    if new[1] != old[1]:
+        params.append(new[1] or "49")
+    return f"\033[{';'.join(params)}m"
+
+# Re-encode text so each visible run is preceded by at most one SGR sequence
+def minimize_sgr(text):
+    out = []
+    wanted = current = DEFAULT_STYLE
+    pos = 0
+    for match in SGR_PATTERN.finditer(text + "\033[0m"):
+        chunk = text[pos:match.start()]
+        if chunk:
+            for run in re.split(r"([ \n]+)", chunk):
+                if not run:
+                    continue
+                # Blank cells look the same in any foreground color, unless
+                # an attribute such as underline or reverse shows on them
+                if wanted != current and not (run.isspace() and wanted[1] == current[1] and not wanted[3] and not current[3]):
+                    out.append(transition(current, wanted))
+                    current = wanted
+                out.append(run)
+        wanted = apply_sgr(wanted, match.group(1))
+        pos = match.end()
+    if current != DEFAULT_STYLE:
+        out.append("\033[0m")
+    return "".join(out)
+
+# Split rendered text into rows of (char, style) cells for differential
+# redraw. Blank cells get the default style since their color never shows.
+def frame_cells(text):
+    rows = [[]]
+    style = DEFAULT_STYLE
+    pos = 0
+    for match in SGR_PATTERN.finditer(text + "\033[0m"):
+        for char in text[pos:match.start()]:
+            if char == "\n":
+                rows.append([])
+            elif char == " " and style[1] is None and not style[3]:
+                rows[-1].append((char, DEFAULT_STYLE))
+            else:
+                rows[-1].append((char, style))
+        style = apply_sgr(style, match.group(1))
+        pos = match.end()
+    return rows
+
+if __name__ == "__main__":
+    import ff_sprite
+    from ff_sprite_data import ff_sprites
+
+    print(f"{'Sprite':<18}{'Before':>8}{'After':>8}{'Saved':>8}")
+    total_before = total_after = 0
+    for character_name, sprite in ff_sprites.items():
+        frame = "\n".join(ff_sprite.frame_lines(character_name, sprite, ff_sprite.DATE_SLOT)) + "\n"
+        before = len(frame.encode())
+        after = len(minimize_sgr(frame).encode())
+        total_before += before
+        total_after += after
+        print(f"{character_name:<18}{before:>8}{after:>8}{1 - after / before:>8.0%}")
+    print(f"{'Total':<18}{total_before:>8}{total_after:>8}{1 - total_after / total_before:>8.0%}")
@@ -52,24 +52,15 @@ create_dir "$SOUNDS_DIR"
 if [ ! -f "$SOUNDS_DIR/cursor.wav" ] || [ ! -f "$SOUNDS_DIR/confirm.wav" ]; then
     echo -e "${YELLOW}Sound files not found. Generating...${NC}"
     
-    # Check if sox is installed
-    if ! command_exists sox; then
-        echo -e "${RED}Error: Sox not installed. Cannot generate sound effects.${NC}"
-        echo -e "${RED}Please install sox and try again.${NC}"
+    # Check if the synthesizer is installed
+    if ! command_exists python3 || [ ! -f "$CONFIG_DIR/kitty/ff_sound.py" ]; then
+        echo -e "${RED}Error: Python 3 or ff_sound.py missing. Cannot generate sound effects.${NC}"
+        echo -e "${RED}Please install python3, run install.sh and try again.${NC}"
         exit 1
     fi
     
-    # Generate FF6-style cursor sound using SoX
-    sox -n "$SOUNDS_DIR/cursor.wav" synth 0.05 sine 1200 fade 0 0.05 0.02 vol 0.5
-    
-    # Generate FF6-style confirm sound using SoX
-    sox -n "$SOUNDS_DIR/confirm.wav" synth 0.1 sine 800:1200 fade 0 0.1 0.03 vol 0.5
-    
-    # Generate FF6-style menu open sound
-    sox -n "$SOUNDS_DIR/menu_open.wav" synth 0.15 sine 600:900 fade 0 0.15 0.05 vol 0.5
-    
-    # Generate FF6-style error sound
-    sox -n "$SOUNDS_DIR/error.wav" synth 0.2 sine 300:200 fade 0 0.2 0.05 vol 0.5
+    # Generate FF6-style cursor, confirm, menu open and error sounds
+    python3 "$CONFIG_DIR/kitty/ff_sound.py" -o "$SOUNDS_DIR" cursor confirm menu_open error
     
     echo -e "${GREEN}Sound effects generated.${NC}"
 else
@@ -192,6 +192,18 @@ test_kitty_config() {
     # Check for required configuration files
     check_file "$KITTY_DIR/kitty.conf" "config"
     check_file "$KITTY_DIR/ff_sprite.py" "FF6 sprite script"
+    check_file "$KITTY_DIR/ff_sprite_data.py" "FF6 sprite data"
+    check_file "$KITTY_DIR/ff_sprite_render.py" "FF6 sprite renderer"
+    check_file "$KITTY_DIR/ff_sprite_graphics.py" "FF6 sprite images"
+    check_file "$KITTY_DIR/ff_sprite_color.py" "FF6 sprite colors"
+    check_file "$KITTY_DIR/ff_sprite_anim.py" "FF6 sprite animation"
+    check_file "$KITTY_DIR/ff_sprite_daemon.py" "FF6 sprite daemon"
+    check_file "$KITTY_DIR/ff_sprite_client.sh" "FF6 sprite client"
+    check_file "$KITTY_DIR/ff_sprite_atlas.py" "FF6 sprite atlas importer"
+    check_file "$KITTY_DIR/ff_sprite_packs.py" "FF6 sprite packs"
+    check_file "$KITTY_DIR/ff_sprite_profile.py" "FF6 sprite profiler"
+    check_file "$KITTY_DIR/ff_sprite_bench.py" "FF6 sprite benchmark"
+    check_file "$KITTY_DIR/ff_sound.py" "FF6 sound synthesizer"
     
     # Test FF6 sprite script
     echo -ne "${YELLOW}Testing FF6 sprite script... ${NC}"
@@ -206,6 +218,26 @@ test_kitty_config() {
     return 0
 }
 
+# Function to benchmark the FF6 sprite script against the stored baseline
+test_sprite_benchmark() {
+    echo -e "${BLUE}Benchmarking FF6 sprite script...${NC}"
+    
+    if [ ! -f "$KITTY_DIR/ff_sprite_bench.py" ]; then
+        echo -e "${YELLOW}Skipping sprite benchmark (ff_sprite_bench.py not installed)${NC}"
+        return 0
+    fi
+    
+    # The first run stores the baseline; later runs fail on regressions
+    if python3 "$KITTY_DIR/ff_sprite_bench.py" --runs 3 --loops 100 -o "${XDG_STATE_HOME:-$HOME/.local/state}/ff6-hyprland/bench-latest.json"; then
+        echo -e "${GREEN}Sprite benchmark passed${NC}"
+    else
+        echo -e "${RED}Sprite benchmark found regressions.${NC}"
+        return 1
+    fi
+    
+    return 0
+}
+
 # Function to test sound effects
 test_sound_effects() {
     echo -e "${BLUE}Testing sound effects...${NC}"
@@ -238,6 +270,7 @@ test_hyprland_config
 test_waybar_config
 test_rofi_config
 test_kitty_config
+test_sprite_benchmark
 test_sound_effects
 
 # Run dotfile validation